@@ -1,17 +1,43 @@
 """Command-line interface for GitHub Issue Extractor."""
 
 import sys
-import yaml
+import copy
+import contextlib
+import json
+import re
+import threading
 import click
-import inquirer
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
-from .github_client import GitHubClient
-from .storage import IssueStorage
-from .tracker import ChangeTracker
-from .reporter import ChangeReporter
-from .project_updater import ProjectUpdater
+# The GitHub client, storage layer, YAML and inquirer stacks are imported
+# inside the commands that use them so that '--help' and '--version' do not
+# pay for loading requests/PyGithub/PyYAML/inquirer on startup. The storage
+# layer and the config loader import PyYAML only when they parse or write
+# YAML, so 'status' with an up-to-date config sidecar never loads it.
+
+# Parsed YAML files keyed by resolved path, each stored with the
+# (st_mtime_ns, st_size, st_ino) signature it was parsed from.
+_YAML_CACHE: "OrderedDict[str, Tuple[Tuple[int, int, int], Any]]" = OrderedDict()
+_YAML_CACHE_MAX_ENTRIES = 32
+_YAML_LOCK = threading.Lock()
+
+# Maximum number of repositories whose issues are fetched concurrently
+_FETCH_WORKERS = 8
+
+# How long a stored listing ETag may stand in for a full listing. A 304 only
+# means the listing's first page is unchanged, which misses some changes to
+# older issues (see GitHubClient.fetch_issues_if_changed), so every
+# repository is fully re-listed at least this often.
+_LISTING_ETAG_MAX_AGE = timedelta(hours=24)
+
+# Free-text answers of the filter prompt; all blank means "no filters"
+_FILTER_TEXT_FIELDS = ('author', 'assignee', 'labels', 'milestone', 'since')
+
+_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
 
 
 @click.group()
@@ -27,7 +53,9 @@ def cli():
 
 @cli.command()
 @click.option('--config', default='config.yaml', help='Path to configuration file')
-def run(config):
+@click.option('--refresh', is_flag=True, help='Fetch the repository and project lists again instead of using the cached copy')
+@click.option('--graphql', is_flag=True, help='Fetch issues and comments through the GraphQL API (fewer requests); falls back to REST on error')
+def run(config, refresh, graphql):
     """Run the GitHub Issue Extractor (main command).
     
     This interactive command will:
@@ -36,6 +64,9 @@ def run(config):
     3. Ask if you want to apply any filters
     4. Extract and save all matching issues
     """
+    from .github_client import GitHubClient
+    from .storage import IssueStorage
+
     click.echo("GitHub Issue Extractor")
     click.echo("=" * 60)
     
@@ -72,7 +103,7 @@ def run(config):
         # Fetch available repositories
         click.echo("\nFetching your accessible repositories...", nl=False)
         try:
-            all_repos = github_client.get_accessible_repositories()
+            all_repos = github_client.get_accessible_repositories(refresh=refresh)
             click.echo(f" Found {len(all_repos)} repositories")
         except Exception as e:
             click.echo(f" FAILED", err=True)
@@ -86,9 +117,7 @@ def run(config):
         # Display repositories
         click.echo(f"\n{'Repository':<50} {'Issues':<10} {'Access'}")
         click.echo("-" * 70)
-        for repo in all_repos[:10]:  # Show first 10
-            access = "Private" if repo['private'] else "Public"
-            click.echo(f"{repo['full_name']:<50} {repo['open_issues']:<10} {access}")
+        click.echo(_format_repo_rows(all_repos[:10]))  # Show first 10
         if len(all_repos) > 10:
             click.echo(f"... and {len(all_repos) - 10} more repositories")
         
@@ -105,7 +134,7 @@ def run(config):
         # Fetch available projects
         click.echo("\nFetching your GitHub Projects...", nl=False)
         try:
-            all_projects = github_client.get_user_projects()
+            all_projects = github_client.get_user_projects(refresh=refresh)
             click.echo(f" Found {len(all_projects)} projects")
         except Exception as e:
             click.echo(f" FAILED", err=True)
@@ -120,9 +149,9 @@ def run(config):
         # Display projects
         click.echo(f"\n{'Project':<50} {'Type'}")
         click.echo("-" * 70)
-        for project in all_projects[:10]:
-            proj_type = project['type'].capitalize()
-            click.echo(f"{project['name']:<50} {proj_type}")
+        click.echo('\n'.join(
+            f"{project['name']:<50} {project['type'].capitalize()}" for project in all_projects[:10]
+        ))
         if len(all_projects) > 10:
             click.echo(f"... and {len(all_projects) - 10} more projects")
         
@@ -194,26 +223,32 @@ def run(config):
         click.echo(" (skipped — no project access or token lacks 'project' scope)")
 
     # Fetch issues from each selected repository
+    # (requests run concurrently; results are saved as each one completes)
     total_issues = 0
-    for repo_name in selected_repos:
+    repo_filters = {repo_name: filters for repo_name in selected_repos}
+    for repo_name, issues, etag, error, graphql_error in _iter_fetched_issues(github_client, repo_filters,
+                                                                              use_graphql=graphql):
+        if graphql_error is not None:
+            _echo_graphql_fallback(repo_name, graphql_error)
         click.echo(f"\nFetching issues from {repo_name}...", nl=False)
         
         try:
-            issues = github_client.fetch_issues(repo_name, filters)
+            if error is not None:
+                raise error
             click.echo(f" Found {len(issues)} issues")
 
             # Overlay project status values
             _overlay_status(issues, repo_name, status_map)
             
-            # Save filters for this repository
-            if filters:
-                storage.save_filters(repo_name, filters)
-            
-            # Save each issue
-            if issues:
-                with click.progressbar(issues, label='Saving issues') as bar:
-                    for issue in bar:
-                        storage.save_issue(repo_name, issue)
+            # Save filters and issues; metadata is written once at the end
+            with storage.batch(repo_name):
+                if filters:
+                    storage.save_filters(repo_name, filters)
+                
+                if issues:
+                    with _iter_with_progress(issues, 'Saving issues') as bar:
+                        storage.save_issues(repo_name, bar)
+                storage.save_listing_etag(repo_name, etag, issues)
             
             total_issues += len(issues)
             click.echo(f"  ✓ Saved {len(issues)} issues")
@@ -236,13 +271,24 @@ def run(config):
 
 @cli.command()
 @click.option('--config', default='config.yaml', help='Path to configuration file')
-def update(config):
+@click.option('--full', is_flag=True, help='Re-download every repository, even if GitHub reports no changes')
+@click.option('--graphql', is_flag=True, help='Fetch issues and comments through the GraphQL API (fewer requests); falls back to REST on error')
+def update(config, full, graphql):
     """Check for changes and update local issue files.
     
     This command checks each configured repository for changes to existing issues
     or new issues. It applies the same filters that were used during fetch.
     Updates local markdown files and generates a detailed change report.
+    
+    Repositories whose issue listing GitHub reports as unchanged since the
+    last sync are skipped without using rate limit, for up to a day after
+    their last full check. Use --full to re-download everything now.
     """
+    from .github_client import GitHubClient
+    from .storage import IssueStorage
+    from .tracker import ChangeTracker
+    from .reporter import ChangeReporter
+
     click.echo("GitHub Issue Extractor - Update Issues")
     click.echo("=" * 60)
     
@@ -283,18 +329,44 @@ def update(config):
     # Track changes for all repositories
     all_changes = {}
     
+    # Load stored filters and listing ETags for each repository, then fetch
+    # all repositories concurrently and process each one as its issues arrive.
+    # A stored ETag is only used while it is recent and the stored project
+    # statuses are still current, since a status change does not change the
+    # GitHub listing. The loaded metadata is handed to the tracker, so each
+    # repository's metadata file is parsed only once for change detection.
+    repo_filters = {}
+    etags = {}
+    stored_metadata = {}
     for repo_name in repos:
+        metadata = storage.load_metadata(repo_name)
+        stored_metadata[repo_name] = metadata
+        tracker.seed_metadata(repo_name, metadata)
+        repo_filters[repo_name] = metadata.get('filters', {})
+        if not full and metadata.get('listing_etag') and _listing_is_recent(metadata) and \
+                _statuses_unchanged(metadata, repo_name, status_map):
+            etags[repo_name] = metadata['listing_etag']
+    
+    for repo_name, current_issues, etag, error, graphql_error in _iter_fetched_issues(
+            github_client, repo_filters, etags, use_graphql=graphql):
+        filters = repo_filters[repo_name]
+        if graphql_error is not None:
+            _echo_graphql_fallback(repo_name, graphql_error)
         click.echo(f"Checking {repo_name}...", nl=False)
         
         try:
-            # Load stored filters for this repository
-            filters = storage.load_filters(repo_name)
+            if error is not None:
+                raise error
+            
+            if current_issues is None:
+                click.echo(f" not modified")
+                unchanged = sorted(int(num) for num in stored_metadata[repo_name]['issues'])
+                all_changes[repo_name] = {'new': [], 'updated': [], 'unchanged': unchanged, 'deleted': []}
+                click.echo(f"  ✓ No changes")
+                continue
             
             if filters:
                 click.echo(f" (applying stored filters)", nl=False)
-            
-            # Fetch current issues with filters
-            current_issues = github_client.fetch_issues(repo_name, filters)
             click.echo(f" {len(current_issues)} issues")
 
             # Overlay project status values before change detection
@@ -302,36 +374,33 @@ def update(config):
             
             # Display filters if any
             if filters:
-                click.echo(f"  Filters: ", nl=False)
-                filter_parts = []
-                if filters.get('author'):
-                    filter_parts.append(f"author={filters['author']}")
-                if filters.get('assignee'):
-                    filter_parts.append(f"assignee={filters['assignee']}")
-                if filters.get('state') and filters['state'] != 'all':
-                    filter_parts.append(f"state={filters['state']}")
-                if filters.get('labels'):
-                    labels_str = ','.join(filters['labels']) if isinstance(filters['labels'], list) else filters['labels']
-                    filter_parts.append(f"labels={labels_str}")
-                click.echo(', '.join(filter_parts))
+                click.echo(f"  Filters: {_format_filters(filters)}")
             
             # Detect changes
             changes = tracker.detect_changes(repo_name, current_issues)
             all_changes[repo_name] = changes
             
-            # Update changed and new issues
+            # Update changed and new issues, then delete issues that are no
+            # longer present (filtered out or removed); metadata is written
+            # once at the end
             issues_to_save = changes['new'] + [u['issue'] for u in changes['updated']]
+            # Entries from before the quick-check fields are rewritten too,
+            # without being reported
+            issues_to_save += changes.pop('resave')
+            # Reuse the markdown rendered for change detection; popping it
+            # keeps it from being held in all_changes until the report
+            rendered = {u['issue']['number']: u.pop('markdown') for u in changes['updated']}
             
-            if issues_to_save:
-                with click.progressbar(issues_to_save, label='  Updating') as bar:
-                    for issue in bar:
-                        storage.save_issue(repo_name, issue)
-            
-            # Delete issues that are no longer present (filtered out or removed)
-            deleted_numbers = tracker.get_deleted_issues(repo_name, current_issues)
-            for number in deleted_numbers:
-                storage.delete_issue(repo_name, number)
-            changes['deleted'] = deleted_numbers
+            with storage.batch(repo_name):
+                if issues_to_save:
+                    with _iter_with_progress(issues_to_save, '  Updating') as bar:
+                        storage.save_issues(repo_name, bar, rendered)
+                
+                deleted_numbers = tracker.get_deleted_issues(repo_name, current_issues)
+                for number in deleted_numbers:
+                    storage.delete_issue(repo_name, number)
+                changes['deleted'] = deleted_numbers
+                storage.save_listing_etag(repo_name, etag, current_issues)
             
             # Print quick summary
             new_count = len(changes['new'])
@@ -373,6 +442,8 @@ def status(config):
     This command displays information about the repositories being tracked
     and the number of issues stored locally.
     """
+    from .storage import IssueStorage
+
     click.echo("GitHub Issue Extractor - Status")
     click.echo("=" * 60)
     
@@ -388,36 +459,25 @@ def status(config):
     
     total_issues = 0
     for repo_name in repos:
-        issue_numbers = storage.get_all_issue_numbers(repo_name)
-        issue_count = len(issue_numbers)
+        # Every saved issue has a metadata entry, so one metadata read gives
+        # both the issue count and the per-state counts
+        metadata = storage.load_metadata(repo_name)
+        issues_data = metadata.get('issues', {})
+        issue_count = len(issues_data)
         total_issues += issue_count
         
         click.echo(f"  {repo_name}: {issue_count} issues")
         
         if issue_count > 0:
-            metadata = storage.load_metadata(repo_name)
-            issues_data = metadata.get('issues', {})
             filters = metadata.get('filters', {})
             
             # Count by state
-            open_count = sum(1 for m in issues_data.values() if m.get('state') == 'open')
-            closed_count = sum(1 for m in issues_data.values() if m.get('state') == 'closed')
-            click.echo(f"    - Open: {open_count}, Closed: {closed_count}")
+            state_counts = Counter(m.get('state') for m in issues_data.values())
+            click.echo(f"    - Open: {state_counts['open']}, Closed: {state_counts['closed']}")
             
             # Show filters if any
             if filters:
-                click.echo(f"    - Filters: ", nl=False)
-                filter_parts = []
-                if filters.get('author'):
-                    filter_parts.append(f"author={filters['author']}")
-                if filters.get('assignee'):
-                    filter_parts.append(f"assignee={filters['assignee']}")
-                if filters.get('state') and filters['state'] != 'all':
-                    filter_parts.append(f"state={filters['state']}")
-                if filters.get('labels'):
-                    labels_str = ','.join(filters['labels']) if isinstance(filters['labels'], list) else filters['labels']
-                    filter_parts.append(f"labels={labels_str}")
-                click.echo(', '.join(filter_parts))
+                click.echo(f"    - Filters: {_format_filters(filters)}")
     
     click.echo(f"\nTotal issues tracked: {total_issues}")
     click.echo(f"Storage location: {storage.base_dir}")
@@ -427,12 +487,16 @@ def status(config):
 @cli.command()
 @click.option('--config', default='config.yaml', help='Path to configuration file')
 @click.option('--save', is_flag=True, help='Automatically save selected repositories to config')
-def discover(config, save):
+@click.option('--refresh', is_flag=True, help='Fetch the repository and project lists again instead of using the cached copy')
+def discover(config, save, refresh):
     """Discover repositories your GitHub account has access to.
     
     This command lists all repositories you can access and lets you
     select which ones to add to your configuration file.
     """
+    import inquirer
+    from .github_client import GitHubClient
+
     click.echo("GitHub Issue Extractor - Discover Repositories")
     click.echo("=" * 60)
     
@@ -454,7 +518,7 @@ def discover(config, save):
     # Fetch repositories
     click.echo("\nFetching accessible repositories...", nl=False)
     try:
-        repos = github_client.get_accessible_repositories()
+        repos = github_client.get_accessible_repositories(refresh=refresh)
         click.echo(f" Found {len(repos)} repositories")
     except Exception as e:
         click.echo(f" FAILED", err=True)
@@ -469,9 +533,9 @@ def discover(config, save):
     click.echo(f"\n{'Repository':<50} {'Issues':<10} {'Access'}")
     click.echo("-" * 70)
     
-    for repo in repos:
-        access = "Private" if repo['private'] else "Public"
-        click.echo(f"{repo['full_name']:<50} {repo['open_issues']:<10} {access}")
+    click.echo(_format_repo_rows(repos[:10]))  # Show first 10; the selection list has them all
+    if len(repos) > 10:
+        click.echo(f"... and {len(repos) - 10} more repositories")
     
     click.echo()
     
@@ -481,13 +545,15 @@ def discover(config, save):
     click.echo()
     
     try:
-        repo_choices = [f"{r['full_name']} ({r['open_issues']} issues)" for r in repos]
+        # (label, value) choices: the answer holds the repository names directly
+        repo_choices = [(f"{r['full_name']} ({r['open_issues']} issues)", r['full_name']) for r in repos]
         
         questions = [
             inquirer.Checkbox(
                 'repos',
                 message="Which repositories do you want to track?",
                 choices=repo_choices,
+                carousel=True,
             )
         ]
         
@@ -497,12 +563,7 @@ def discover(config, save):
             click.echo("\nNo repositories selected.")
             sys.exit(0)
         
-        # Extract repository names from selections (remove issue count)
-        selected = []
-        for selection in answers['repos']:
-            # Format is "owner/repo (X issues)"
-            repo_name = selection.split(' (')[0]
-            selected.append(repo_name)
+        selected = answers['repos']
         
         click.echo(f"\nSelected {len(selected)} repositories:")
         for repo in selected:
@@ -551,6 +612,9 @@ def push(config, dry_run):
     have a stored file hash.  Run 'python -m src update' first to populate
     hashes for all existing issues, then edit and push as normal.
     """
+    from .github_client import GitHubClient
+    from .storage import IssueStorage
+
     click.echo("GitHub Issue Extractor - Push Local Edits")
     click.echo("=" * 60)
 
@@ -675,6 +739,10 @@ def set_status(repo, issue_number, status, project, org, list_statuses):
     NOTE: Your GITHUB_TOKEN must have the 'project' scope (read:project is
     not sufficient for mutations).
     """
+    from .github_client import GitHubClient
+    from .storage import IssueStorage
+    from .project_updater import ProjectUpdater
+
     # Infer org from repo owner if not provided
     if org is None:
         parts = repo.split('/')
@@ -774,6 +842,9 @@ def comment(repo, issue_number, body):
 
     NOTE: Your GITHUB_TOKEN must have the 'repo' scope to post comments.
     """
+    from .github_client import GitHubClient
+    from .storage import IssueStorage
+
     try:
         github_client = GitHubClient()
         storage = IssueStorage()
@@ -816,8 +887,7 @@ def load_config(config_path: str) -> List[str]:
         sys.exit(1)
     
     try:
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        config = _read_yaml_cached(config_file) or {}
         
         repos = config.get('repositories', [])
         # Filter out None, empty strings, and comments
@@ -826,7 +896,7 @@ def load_config(config_path: str) -> List[str]:
         repos = [r for r in repos if r and isinstance(r, str)]
         
         return repos
-    except yaml.YAMLError as e:
+    except ValueError as e:
         click.echo(f"Error parsing configuration file: {e}", err=True)
         sys.exit(1)
 
@@ -838,21 +908,27 @@ def save_to_config(config_path: str, repositories: List[str]):
         config_path: Path to configuration file
         repositories: List of repository names to save
     """
+    import yaml
+    from .storage import yaml_classes
+
     config_file = Path(config_path)
     
     # Load existing config or create new structure
     if config_file.exists():
         try:
-            with open(config_file, 'r') as f:
-                config = yaml.safe_load(f) or {}
-        except yaml.YAMLError:
+            # The cached object is shared, so copy before mutating it below
+            config = copy.deepcopy(_read_yaml_cached(config_file)) or {}
+        except ValueError:
             config = {}
     else:
         config = {}
     
-    # Merge with existing repositories (avoid duplicates)
-    existing_repos = set(config.get('repositories', []) or [])
-    all_repos = sorted(list(existing_repos.union(set(repositories))))
+    # Merge with existing repositories, dropping duplicates but keeping the
+    # existing order so that re-saving does not reshuffle a committed file.
+    # A brand-new file starts out sorted.
+    all_repos = list(dict.fromkeys((config.get('repositories') or []) + list(repositories)))
+    if not config_file.exists():
+        all_repos.sort()
     
     config['repositories'] = all_repos
     
@@ -861,11 +937,121 @@ def save_to_config(config_path: str, repositories: List[str]):
         with open(config_file, 'w') as f:
             f.write("# GitHub Issue Extractor Configuration\n")
             f.write("# Repositories to track\n\n")
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            _, dumper = yaml_classes()
+            yaml.dump(config, f, Dumper=dumper, default_flow_style=False, sort_keys=False)
     except Exception as e:
         click.echo(f"Error saving configuration: {e}", err=True)
         sys.exit(1)
 
+    _write_sidecar(config_file, config)
+
+
+def _read_yaml_cached(path: Path) -> Any:
+    """Parse a YAML file, reusing the previous result while it is unchanged.
+
+    The file is re-parsed only when its mtime, size or inode differ from the
+    ones recorded at the last parse, so repeated loads within one process
+    cost a single stat() call. The returned object is shared between
+    callers and must not be mutated.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        The parsed YAML document
+
+    Raises:
+        ValueError: If the file cannot be parsed
+    """
+    st = path.stat()
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    key = str(path.resolve())
+
+    with _YAML_LOCK:
+        cached = _YAML_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            _YAML_CACHE.move_to_end(key)
+            return cached[1]
+
+    data = _load_yaml_via_sidecar(path, (st.st_mtime_ns, st.st_size))
+
+    with _YAML_LOCK:
+        _YAML_CACHE[key] = (signature, data)
+        _YAML_CACHE.move_to_end(key)
+        while len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+            _YAML_CACHE.popitem(last=False)
+
+    return data
+
+
+def _sidecar_path(path: Path) -> Path:
+    """Return the path of the JSON sidecar cache for a YAML file."""
+    return path.with_name(path.name + '.cache.json')
+
+
+def _load_yaml_via_sidecar(path: Path, yaml_signature: Tuple[int, int]) -> Any:
+    """Load a YAML file, preferring its JSON sidecar when it is up to date.
+
+    The YAML file stays the source of truth: the sidecar records the
+    (mtime_ns, size) of the YAML file it was made from and is only used when
+    both match exactly, so a restored or copied config.yaml with an older
+    timestamp is never shadowed. Any problem reading the sidecar falls back
+    to parsing the YAML (which refreshes the sidecar). PyYAML is imported
+    only then, so a sidecar hit does not pay for loading it.
+
+    Args:
+        path: Path to the YAML file
+        yaml_signature: (st_mtime_ns, st_size) of the YAML file
+
+    Returns:
+        The parsed YAML document
+
+    Raises:
+        ValueError: If the YAML file has to be parsed and is invalid
+    """
+    try:
+        with open(_sidecar_path(path), 'r', encoding='utf-8') as f:
+            sidecar = json.load(f)
+        if sidecar.get('yaml_signature') == list(yaml_signature):
+            return sidecar['data']
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass  # Missing, unreadable, corrupt or stale sidecar: re-parse the YAML
+
+    import yaml
+    from .storage import yaml_classes
+
+    loader, _ = yaml_classes()
+    try:
+        with open(path, 'r') as f:
+            data = yaml.load(f, Loader=loader)
+    except yaml.YAMLError as e:
+        raise ValueError(str(e)) from e
+
+    _write_sidecar(path, data, yaml_signature)
+    return data
+
+
+def _write_sidecar(path: Path, data: Any, yaml_signature: Optional[Tuple[int, int]] = None):
+    """Write the JSON sidecar cache for a YAML file (best-effort).
+
+    Documents that cannot be represented as JSON, and directories that are
+    not writable, simply leave the sidecar absent.
+
+    Args:
+        path: Path to the YAML file
+        data: Parsed YAML document to cache
+        yaml_signature: (st_mtime_ns, st_size) of the YAML file the data was
+            parsed from; read from the file now if not given
+    """
+    try:
+        if yaml_signature is None:
+            st = path.stat()
+            yaml_signature = (st.st_mtime_ns, st.st_size)
+        payload = json.dumps({'yaml_signature': list(yaml_signature), 'data': data})
+        _sidecar_path(path).write_text(payload, encoding='utf-8')
+    except (OSError, TypeError, ValueError):
+        pass
+
 
 def select_repositories(all_repos: List[str]) -> List[str]:
     """Interactive multi-select for choosing repositories.
@@ -876,6 +1062,8 @@ def select_repositories(all_repos: List[str]) -> List[str]:
     Returns:
         List of selected repository names
     """
+    import inquirer
+
     if not all_repos:
         return []
     
@@ -922,6 +1110,8 @@ def prompt_selection_method() -> Optional[str]:
     Returns:
         'repositories' or 'projects', or None if cancelled
     """
+    import inquirer
+
     try:
         questions = [
             inquirer.List(
@@ -957,11 +1147,14 @@ def select_repos_from_list(repos: List[Dict[str, Any]]) -> List[str]:
     Returns:
         List of selected repository full names (owner/repo)
     """
+    import inquirer
+
     if not repos:
         return []
     
     try:
-        repo_choices = [f"{r['full_name']} ({r['open_issues']} issues)" for r in repos]
+        # (label, value) choices: the answer holds the repository names directly
+        repo_choices = [(f"{r['full_name']} ({r['open_issues']} issues)", r['full_name']) for r in repos]
         
         questions = [
             inquirer.Checkbox(
@@ -973,17 +1166,10 @@ def select_repos_from_list(repos: List[Dict[str, Any]]) -> List[str]:
         
         answers = inquirer.prompt(questions)
         
-        if answers is None or not answers.get('repos'):
+        if answers is None:
             return []
         
-        # Extract repository names from selections (remove issue count)
-        selected = []
-        for selection in answers['repos']:
-            # Format is "owner/repo (X issues)"
-            repo_name = selection.split(' (')[0]
-            selected.append(repo_name)
-        
-        return selected
+        return answers.get('repos', [])
         
     except KeyboardInterrupt:
         click.echo("\n\nCancelled by user.")
@@ -1002,6 +1188,8 @@ def select_project_from_list(projects: List[Dict[str, Any]]) -> Optional[Dict[st
     Returns:
         Selected project dictionary, or None if cancelled
     """
+    import inquirer
+
     if not projects:
         return None
     
@@ -1037,42 +1225,45 @@ def prompt_for_filters() -> Dict[str, Any]:
     Returns:
         Dictionary of filter parameters
     """
+    import inquirer
+
     filters = {}
     
     try:
-        # Ask if user wants to apply filters
+        # Ask everything in a single prompt; the filter questions are skipped
+        # unless the user opts in to filtering (blank answers are ignored)
+        def skip_filters(answers):
+            return not answers.get('apply_filters')
+        
         questions = [
             inquirer.Confirm(
                 'apply_filters',
                 message="Do you want to apply any filters? (No = fetch all issues)",
                 default=False
-            )
-        ]
-        
-        answers = inquirer.prompt(questions)
-        
-        if not answers or not answers.get('apply_filters'):
-            click.echo("No filters applied. Will fetch all issues.")
-            return {}
-        
-        click.echo("\nFilter options (leave blank to skip):")
-        
-        # Ask for each filter
-        filter_questions = [
-            inquirer.Text('author', message="Filter by author (username)"),
-            inquirer.Text('assignee', message="Filter by assignee (username)"),
+            ),
+            inquirer.Text('author', message="Filter by author (username, blank to skip)",
+                          ignore=skip_filters),
+            inquirer.Text('assignee', message="Filter by assignee (username, blank to skip)",
+                          ignore=skip_filters),
             inquirer.List('state',
                          message="Filter by state",
                          choices=['all', 'open', 'closed'],
-                         default='all'),
-            inquirer.Text('labels', message="Filter by labels (comma-separated)"),
-            inquirer.Text('milestone', message="Filter by milestone (title, '*' for any, 'none' for no milestone)"),
-            inquirer.Text('since', message="Filter since date (YYYY-MM-DD)"),
+                         default='all',
+                         ignore=skip_filters),
+            inquirer.Text('labels', message="Filter by labels (comma-separated, blank to skip)",
+                          ignore=skip_filters),
+            inquirer.Text('milestone', message="Filter by milestone (title, '*' for any, 'none' for no milestone)",
+                          ignore=skip_filters),
+            inquirer.Text('since', message="Filter since date (YYYY-MM-DD, blank to skip)",
+                          ignore=skip_filters),
         ]
         
-        filter_answers = inquirer.prompt(filter_questions)
+        filter_answers = inquirer.prompt(questions)
         
-        if not filter_answers:
+        if (not filter_answers or not filter_answers.get('apply_filters')
+                or (not any(filter_answers.get(key) for key in _FILTER_TEXT_FIELDS)
+                    and filter_answers.get('state') in (None, 'all'))):
+            click.echo("No filters applied. Will fetch all issues.")
             return {}
         
         # Build filters dictionary
@@ -1084,8 +1275,6 @@ def prompt_for_filters() -> Dict[str, Any]:
         
         if filter_answers.get('state') and filter_answers['state'] != 'all':
             filters['state'] = filter_answers['state']
-        elif filter_answers.get('state') == 'all':
-            filters['state'] = 'all'
         
         if filter_answers.get('labels'):
             filters['labels'] = [l.strip() for l in filter_answers['labels'].split(',')]
@@ -1126,6 +1315,9 @@ def build_filters(author: Optional[str], assignee: Optional[str], milestone: Opt
     Returns:
         Dictionary of filters (empty if no filters provided)
     """
+    if not any((author, assignee, milestone, labels, since, until)) and state in (None, '', 'all'):
+        return {}
+    
     filters = {}
     
     if author:
@@ -1143,8 +1335,6 @@ def build_filters(author: Optional[str], assignee: Optional[str], milestone: Opt
     
     if state and state != 'all':
         filters['state'] = state
-    elif state == 'all':
-        filters['state'] = 'all'
     
     if since:
         # Validate date format
@@ -1166,8 +1356,9 @@ def build_filters(author: Optional[str], assignee: Optional[str], milestone: Opt
 def validate_date(date_str: str) -> bool:
     """Validate date string format (YYYY-MM-DD).
 
-    Uses strptime with an explicit format so that partial ISO strings such as
-    '2024-01' or '2024' are rejected (fromisoformat accepts them on Python 3.11+).
+    The shape is checked with a precompiled pattern, so partial or extended
+    ISO strings such as '2024-01' or '2024-01-01T12:00:00' are rejected, and
+    the captured fields are then checked for being a real calendar date.
 
     Args:
         date_str: Date string to validate
@@ -1176,10 +1367,15 @@ def validate_date(date_str: str) -> bool:
         True if valid, False otherwise
     """
     try:
-        from datetime import datetime
-        datetime.strptime(date_str, '%Y-%m-%d')
+        match = _DATE_RE.fullmatch(date_str)
+    except TypeError:
+        return False
+    if not match:
+        return False
+    try:
+        date(*map(int, match.groups()))
         return True
-    except (ValueError, AttributeError):
+    except ValueError:
         return False
 
 
@@ -1214,6 +1410,128 @@ def display_filters(filters: Dict[str, Any]):
         click.echo(f"  - Until: {filters['until']}")
 
 
+def _iter_fetched_issues(github_client, repo_filters: Dict[str, Dict[str, Any]],
+                         etags: Optional[Dict[str, str]] = None, use_graphql: bool = False
+                         ) -> Iterator[Tuple[str, Optional[List[Dict[str, Any]]], Optional[str],
+                                             Optional[Exception], Optional[Exception]]]:
+    """Fetch issues for several repositories concurrently.
+
+    Fetching is network-bound, so up to _FETCH_WORKERS repositories are
+    requested in parallel. Results are yielded on the calling thread in the
+    order of repo_filters, each as soon as it and those before it are done,
+    so callers can save and print without locking and repeated runs report
+    repositories in the same order.
+
+    Args:
+        github_client: GitHubClient instance
+        repo_filters: Dict mapping repository names to the filters to apply
+        etags: Optional dict mapping repository names to the listing ETag
+            of their previous fetch; those listings are fetched only if
+            they changed since
+        use_graphql: Fetch through the GraphQL API (see
+            GitHubClient.fetch_issues_if_changed)
+
+    Yields:
+        Tuples of (repo_name, issues, etag, error, graphql_error). On error,
+        issues and etag are None. Otherwise error is None, and issues is None
+        only if the listing was not modified since the given ETag.
+        graphql_error is set when a GraphQL fetch fell back to REST.
+    """
+    if not repo_filters:
+        return
+    etags = etags or {}
+
+    workers = min(_FETCH_WORKERS, len(repo_filters))
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = []
+    try:
+        for repo_name, filters in repo_filters.items():
+            future = executor.submit(github_client.fetch_issues_if_changed, repo_name, filters,
+                                     etags.get(repo_name), use_graphql=use_graphql)
+            futures.append((repo_name, future))
+        # Later fetches keep running while an earlier one is awaited
+        for repo_name, future in futures:
+            try:
+                issues, etag, graphql_error = future.result()
+                yield repo_name, issues, etag, None, graphql_error
+            except Exception as e:
+                yield repo_name, None, None, e, None
+    finally:
+        # Don't wait for queued fetches if the consumer stopped early (Ctrl-C,
+        # an error while saving): drop those that haven't started and let the
+        # running ones finish in the background. Cancelling by hand rather
+        # than with shutdown(cancel_futures=True) keeps Python 3.8 working.
+        for _, future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _echo_graphql_fallback(repo_name: str, error: Exception):
+    """Warn that a repository's GraphQL fetch failed and REST was used instead.
+
+    Args:
+        repo_name: Full repository name in 'owner/repo' format
+        error: The exception the GraphQL fetch raised
+    """
+    click.echo(f"Warning: GraphQL fetch of {repo_name} failed ({error}); used the REST API instead.",
+               err=True)
+
+
+def _iter_with_progress(items: List[Any], label: str):
+    """Wrap items in a progress bar when stdout is an interactive terminal.
+
+    Under cron or CI the bar is never seen, so the items are passed through
+    untouched instead of paying for per-item bar updates.
+
+    Args:
+        items: Items to iterate over
+        label: Progress bar label
+
+    Returns:
+        Context manager yielding an iterable over items
+    """
+    if sys.stdout.isatty():
+        return click.progressbar(items, label=label)
+    return contextlib.nullcontext(items)
+
+
+def _format_repo_rows(repos: List[Dict[str, Any]]) -> str:
+    """Format repositories as rows of the 'Repository / Issues / Access' table.
+
+    The rows are returned as one string so that the table is written with a
+    single echo call rather than one per row.
+
+    Args:
+        repos: List of repository dictionaries with metadata
+
+    Returns:
+        Newline-separated table rows
+    """
+    return '\n'.join(
+        f"{r['full_name']:<50} {r['open_issues']:<10} {'Private' if r['private'] else 'Public'}"
+        for r in repos
+    )
+
+
+def _format_filters(filters: Dict[str, Any]) -> str:
+    """Format filters as a compact one-line summary, e.g. 'author=bob, labels=a,b'.
+
+    Args:
+        filters: Dictionary of filter parameters
+
+    Returns:
+        Comma-separated 'key=value' pairs, or '' if no summarised filter is set
+    """
+    labels = filters.get('labels')
+    values = {
+        'author': filters.get('author'),
+        'assignee': filters.get('assignee'),
+        'state': filters.get('state') if filters.get('state') != 'all' else None,
+        'labels': ','.join(labels) if isinstance(labels, list) else labels,
+    }
+    return ', '.join([f"{key}={value}" for key, value in values.items() if value])
+
+
 def _build_status_map(repos: List[str]) -> Dict:
     """Fetch a (repo_name_lower, issue_number) -> status map for all orgs in repos.
 
@@ -1230,6 +1548,8 @@ def _build_status_map(repos: List[str]) -> Dict:
     if not orgs:
         return {}
 
+    from .project_updater import ProjectUpdater
+
     try:
         updater = ProjectUpdater()
     except Exception:
@@ -1246,6 +1566,40 @@ def _build_status_map(repos: List[str]) -> Dict:
     return combined
 
 
+def _listing_is_recent(metadata: Dict[str, Any]) -> bool:
+    """Check whether a repository's last full listing is recent enough to skip on a 304.
+
+    Args:
+        metadata: The repository's metadata as returned by IssueStorage.load_metadata
+
+    Returns:
+        True if the listing was fetched less than _LISTING_ETAG_MAX_AGE ago
+    """
+    try:
+        fetched_at = datetime.fromisoformat(metadata['listing_fetched_at'])
+    except (KeyError, TypeError, ValueError):
+        return False
+    return datetime.now(timezone.utc) - fetched_at < _LISTING_ETAG_MAX_AGE
+
+
+def _statuses_unchanged(metadata: Dict[str, Any], repo_name: str, status_map: Dict) -> bool:
+    """Check whether the project statuses stored for a repository are still current.
+
+    Args:
+        metadata: The repository's metadata as returned by IssueStorage.load_metadata
+        repo_name: Full repository name in 'owner/repo' format
+        status_map: Dict from _build_status_map
+
+    Returns:
+        True if every stored issue has the status status_map gives it
+    """
+    repo_key = repo_name.lower()
+    return all(
+        entry.get('status') == status_map.get((repo_key, int(number)))
+        for number, entry in metadata.get('issues', {}).items()
+    )
+
+
 def _overlay_status(issues: List[Dict[str, Any]], repo_name: str, status_map: Dict) -> List[Dict[str, Any]]:
     """Apply project status values from status_map onto the issue dicts in-place.
 
@@ -1,28 +1,231 @@
 """GitHub API client for fetching issues."""
 
 import os
-from typing import List, Dict, Any, Optional
+import re
+import time
+import threading
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 from datetime import datetime, timezone
-from github import Github, GithubException
+from pathlib import Path
+from github import Github, GithubException, GithubRetry
 from dotenv import load_dotenv
+import requests
 import requests.exceptions
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+
+
+API_URL = "https://api.github.com"
+
+# Maximum number of per-issue comment listings requested concurrently
+COMMENT_FETCH_WORKERS = 10
+
+# Maximum number of API requests in flight at once across all threads (the
+# CLI fetches several repositories in parallel, each with its own comment
+# workers); also the size of the session's connection pool
+MAX_CONCURRENT_REQUESTS = 16
+
+# When all of a repository's issues are listed and fetching their comments
+# per issue would take more than this many requests, comments are read from
+# the single repository-wide listing instead
+BULK_COMMENTS_MIN_REQUESTS = 10
+
+# Wait for the rate-limit reset once fewer requests than this remain
+RATE_LIMIT_THRESHOLD = 50
+
+# Transient server errors are retried with exponential backoff (2s, 4s, ...)
+RETRY_TOTAL = 8
+RETRY_BACKOFF_FACTOR = 2
+RETRY_STATUSES = [429, 502, 503, 504]
+
+# First wait after a secondary rate limit without a Retry-After header;
+# doubled on each further hit
+SECONDARY_RATE_LIMIT_WAIT = 60
+
+# Extracts 'owner/repo' from a project card's content URL, e.g.
+# https://api.github.com/repos/owner/repo/issues/123
+_CONTENT_URL_RE = re.compile(r'/repos/([^/]+/[^/]+)/issues/')
+
+GRAPHQL_URL = f"{API_URL}/graphql"
+
+_COMMENT_FIELDS_FRAGMENT = """
+fragment CommentFields on IssueComment {
+  author {
+    login
+    __typename
+  }
+  body
+  createdAt
+  updatedAt
+}
+"""
+
+# Issues with their first 100 comments, 100 issues per request
+_ISSUES_QUERY = """
+query($owner: String!, $name: String!, $cursor: String, $filterBy: IssueFilters,
+      $orderBy: IssueOrder, $withComments: Boolean!) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $cursor, filterBy: $filterBy, orderBy: $orderBy) {
+      nodes {
+        number
+        title
+        body
+        state
+        url
+        createdAt
+        updatedAt
+        closedAt
+        author {
+          login
+          __typename
+        }
+        labels(first: 100) {
+          nodes {
+            name
+          }
+        }
+        assignees(first: 100) {
+          nodes {
+            login
+          }
+        }
+        milestone {
+          title
+        }
+        comments(first: 100) @include(if: $withComments) {
+          nodes {
+            ...CommentFields
+          }
+          pageInfo {
+            hasNextPage
+            endCursor
+          }
+        }
+      }
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+    }
+  }
+}
+""" + _COMMENT_FIELDS_FRAGMENT
+
+# Further comments of one issue with more than 100
+_ISSUE_COMMENTS_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issue(number: $number) {
+      comments(first: 100, after: $cursor) {
+        nodes {
+          ...CommentFields
+        }
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+      }
+    }
+  }
+}
+""" + _COMMENT_FIELDS_FRAGMENT
+
+# Repository and project lists are cached on disk for this many seconds;
+# override with GHIE_CACHE_TTL (0 disables the cache)
+DEFAULT_CACHE_TTL = 3600
+
+
+def _normalize_timestamp(value: Optional[str]) -> Optional[str]:
+    """Convert a REST API timestamp to the format PyGithub produces.
+
+    The REST API returns e.g. '2024-01-15T10:00:00Z' while PyGithub's
+    datetime.isoformat() gives '2024-01-15T10:00:00+00:00'. Issue files and
+    change-detection hashes use the latter, so both fetch paths must agree.
+    """
+    if value and value.endswith('Z'):
+        return value[:-1] + '+00:00'
+    return value
+
+
+class _TokenState:
+    """Rate-limit bookkeeping for one token of the rotation pool.
+
+    GitHub keeps a separate quota per resource ('core' for REST, 'graphql'),
+    so both values are kept by resource name.
+    """
+
+    def __init__(self, token: str):
+        self.token = token
+        self.remaining: Dict[str, int] = {}  # Unknown until the first response
+        self.reset_at: Dict[str, float] = {}  # Epoch seconds of the next quota reset
 
 
 class GitHubClient:
     """Client for interacting with GitHub API to fetch issues."""
     
     def __init__(self):
-        """Initialize the GitHub client with authentication."""
+        """Initialize the GitHub client with authentication.
+
+        Reads a comma-separated GITHUB_TOKENS list if set, otherwise the single
+        GITHUB_TOKEN. The bulk REST reads rotate through every token, so N
+        tokens give N times the hourly quota; user-scoped calls (listing your
+        repositories and projects, posting comments, editing issues) always
+        use the first token.
+        """
         load_dotenv()
-        token = os.getenv('GITHUB_TOKEN')
+        tokens = os.getenv('GITHUB_TOKENS') or os.getenv('GITHUB_TOKEN') or ''
+        tokens = list(dict.fromkeys(t.strip() for t in tokens.split(',') if t.strip()))
         
-        if not token:
+        if not tokens:
             raise ValueError(
                 "GITHUB_TOKEN not found in environment variables. "
                 "Please create a .env file with your GitHub token."
             )
+        token = tokens[0]
+        
+        self._login: Optional[str] = None  # Set by test_connection or on first cache use
+        self._cache_ttl = self._parse_cache_ttl(os.getenv('GHIE_CACHE_TTL'))
+        
+        self._tokens = deque(_TokenState(t) for t in tokens)
+        self._tokens_lock = threading.Lock()
+        
+        # GithubRetry additionally retries 403s that are rate-limit errors,
+        # waiting for the primary limit's reset or backing off from the
+        # secondary limit; other 403s (no access) fail immediately
+        self.client = Github(
+            token,
+            per_page=100,
+            retry=GithubRetry(
+                total=RETRY_TOTAL,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUSES,
+            ),
+        )
         
-        self.client = Github(token)
+        # Plain REST session for the bulk issue/comment listings, which only
+        # need a few fields per item and are cheaper as raw JSON
+        self._session = requests.Session()
+        # (the Authorization header is set per request by _request)
+        self._session.headers.update({
+            'Accept': 'application/vnd.github+json',
+        })
+        # Requests from every thread share this session, so its pool holds
+        # as many connections as may be in flight (see _request)
+        self._session.mount(API_URL, HTTPAdapter(
+            pool_maxsize=MAX_CONCURRENT_REQUESTS,
+            max_retries=Retry(
+                total=RETRY_TOTAL,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=frozenset({'GET'}),
+                raise_on_status=False,
+            ),
+        ))
+        self._request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
         
     def test_connection(self) -> bool:
         """Test the GitHub API connection and token validity.
@@ -32,10 +235,96 @@ class GitHubClient:
         """
         try:
             user = self.client.get_user()
-            user.login  # Force API call
+            self._login = user.login  # Force API call
             return True
         except (GithubException, requests.exceptions.RequestException):
             return False
+    
+    def _cache_path(self, kind: str) -> Path:
+        """Return the disk cache file for a per-user listing.
+        
+        Files live in $XDG_CACHE_HOME/ghissue-extractor (default
+        ~/.cache/ghissue-extractor) and are keyed by the authenticated login,
+        so switching tokens never serves another account's list.
+        
+        Args:
+            kind: Listing name, e.g. 'repos' or 'projects'
+            
+        Returns:
+            Path of the cache file
+        """
+        if self._login is None:
+            self._login = self.client.get_user().login
+        cache_home = os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache'
+        return Path(cache_home) / 'ghissue-extractor' / f"{kind}-{self._login}.json"
+    
+    @staticmethod
+    def _parse_cache_ttl(value: Optional[str]) -> int:
+        """Parse the GHIE_CACHE_TTL setting.
+        
+        An invalid value is reported with a warning and DEFAULT_CACHE_TTL is
+        used instead, so a typo does not break commands that never touch the
+        cache.
+        
+        Args:
+            value: Raw environment value, or None if unset
+            
+        Returns:
+            Cache lifetime in seconds
+        """
+        if value is None or not value.strip():
+            return DEFAULT_CACHE_TTL
+        try:
+            return int(value)
+        except ValueError:
+            warnings.warn(
+                f"Ignoring invalid GHIE_CACHE_TTL={value!r} (expected whole seconds); "
+                f"using {DEFAULT_CACHE_TTL}.",
+                RuntimeWarning,
+            )
+            return DEFAULT_CACHE_TTL
+    
+    def _read_cache(self, kind: str) -> Optional[List[Dict[str, Any]]]:
+        """Return a cached listing if it is younger than the cache TTL.
+        
+        Args:
+            kind: Listing name, e.g. 'repos' or 'projects'
+            
+        Returns:
+            The cached list, or None if missing, expired, disabled or unreadable
+        """
+        if self._cache_ttl <= 0:
+            return None
+        try:
+            cached = orjson.loads(self._cache_path(kind).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        if not isinstance(cached, dict):
+            return None  # Truncated or hand-edited file
+        try:
+            if time.time() - cached.get('fetched_at', 0) >= self._cache_ttl:
+                return None
+        except (TypeError, ValueError):
+            return None
+        return cached.get('data')
+    
+    def _write_cache(self, kind: str, data: List[Dict[str, Any]]):
+        """Store a listing in the disk cache. Failures are ignored.
+        
+        Args:
+            kind: Listing name, e.g. 'repos' or 'projects'
+            data: The listing to cache
+        """
+        if self._cache_ttl <= 0:
+            return
+        try:
+            path = self._cache_path(kind)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + '.tmp')
+            tmp_path.write_bytes(orjson.dumps({'fetched_at': time.time(), 'data': data}))
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
 
     @staticmethod
     def _parse_date_to_aware(date_str: str) -> datetime:
@@ -55,15 +344,25 @@ class GitHubClient:
             dt = dt.replace(tzinfo=timezone.utc)
         return dt
     
-    def get_accessible_repositories(self) -> List[Dict[str, Any]]:
+    def get_accessible_repositories(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """Get all repositories the authenticated user has access to.
         
+        The list is cached on disk for GHIE_CACHE_TTL seconds (default 1 hour).
+        
+        Args:
+            refresh: Ignore the cached list and fetch it again
+        
         Returns:
             List of repository dictionaries with name, description, and metadata
         """
         repos = []
         
         try:
+            if not refresh:
+                cached = self._read_cache('repos')
+                if cached is not None:
+                    return cached
+            
             # Get user's own repositories
             user = self.client.get_user()
             
@@ -78,20 +377,32 @@ class GitHubClient:
                     'url': repo.html_url,
                 })
             
-            return sorted(repos, key=lambda x: x['full_name'].lower())
+            repos = sorted(repos, key=lambda x: x['full_name'].lower())
+            self._write_cache('repos', repos)
+            return repos
             
         except GithubException as e:
             raise Exception(f"Failed to fetch repositories: {str(e)}")
     
-    def get_user_projects(self) -> List[Dict[str, Any]]:
+    def get_user_projects(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """Get all GitHub Projects (classic and new) the user has access to.
         
+        The list is cached on disk for GHIE_CACHE_TTL seconds (default 1 hour).
+        
+        Args:
+            refresh: Ignore the cached list and fetch it again
+        
         Returns:
             List of project dictionaries with name, description, and metadata
         """
         projects = []
         
         try:
+            if not refresh:
+                cached = self._read_cache('projects')
+                if cached is not None:
+                    return cached
+            
             user = self.client.get_user()
             
             # Get projects from user's organizations
@@ -132,7 +443,9 @@ class GitHubClient:
             except Exception:
                 pass
             
-            return sorted(projects, key=lambda x: x['name'].lower())
+            projects = sorted(projects, key=lambda x: x['name'].lower())
+            self._write_cache('projects', projects)
+            return projects
             
         except GithubException as e:
             raise Exception(f"Failed to fetch projects: {str(e)}")
@@ -156,17 +469,12 @@ class GitHubClient:
             for column in project.get_columns():
                 # Get all cards in each column
                 for card in column.get_cards():
-                    # If card has content (an issue or PR)
+                    # If card has content (an issue or PR), take the repo
+                    # from its content URL
                     if card.content_url:
-                        try:
-                            # Extract repo from content URL
-                            # Format: https://api.github.com/repos/owner/repo/issues/123
-                            parts = card.content_url.split('/repos/')
-                            if len(parts) > 1:
-                                repo_path = parts[1].split('/issues/')[0]
-                                repos.add(repo_path)
-                        except Exception:
-                            pass
+                        match = _CONTENT_URL_RE.search(card.content_url)
+                        if match:
+                            repos.add(match.group(1))
             
             return sorted(list(repos))
             
@@ -188,29 +496,73 @@ class GitHubClient:
                 - since: ISO format date string (YYYY-MM-DD)
                 - until: ISO format date string (YYYY-MM-DD)
             include_comments: Whether to fetch comments for each issue.
-                Fetching comments costs one extra API call per issue.
-                Keep True (default) when saving full issue files; pass False
-                when only metadata is needed.
+                Comments come from the repository-wide comments listing (one
+                call per 100 comments), or from concurrent per-issue calls when
+                only a few issues have any. Keep True (default) when saving
+                full issue files; pass False when only metadata is needed.
             
         Returns:
             List of issue dictionaries with all relevant data
             
         Raises:
-            GithubException: If repository not found or access denied
+            Exception: If repository not found or access denied
+        """
+        issues, _, _ = self.fetch_issues_if_changed(repo_name, filters, include_comments=include_comments)
+        return issues
+    
+    def fetch_issues_if_changed(self, repo_name: str, filters: Optional[Dict[str, Any]] = None,
+                                etag: Optional[str] = None, include_comments: bool = True,
+                                use_graphql: bool = False
+                                ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str], Optional[Exception]]:
+        """Fetch issues like fetch_issues, unless the listing is unchanged since a previous fetch.
+        
+        Without an 'until' filter the listing is sorted by last update, so
+        anything that bumps an issue's updated_at (an edit of the issue
+        itself, a new comment, a label or state change, a new issue) changes
+        its first page. That page is requested with If-None-Match: etag, and
+        GitHub answers 304 Not Modified, without charging the rate limit,
+        when it did not change.
+        
+        Changes that do not bump updated_at are missed by that check when the
+        issue is not on the first page: comments being edited or deleted, a
+        label being renamed, and the issue being deleted or transferred. They
+        show up on the next fetch that is not answered with 304, so callers
+        should not rely on the etag indefinitely.
+        
+        With use_graphql, the check is made on a one-item REST page (any
+        change still moves an issue to its top) and the issues are then
+        fetched with _query_issues_graphql. If the GraphQL fetch fails, the
+        REST listing is used instead and the error is returned alongside. The 'none'
+        milestone filter (issues without a milestone) always uses REST.
+        
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            filters: Optional filter dictionary, see fetch_issues
+            etag: ETag returned by the previous call for the same filters, if any
+            include_comments: Whether to fetch comments for each issue
+            use_graphql: Fetch issues and comments through the GraphQL API
+            
+        Returns:
+            Tuple of (issues, etag, graphql_error). issues is None when GitHub
+            reported the listing as not modified. etag is the value to pass
+            next time, or None when the listing cannot be cached (an 'until'
+            filter is set). graphql_error is the exception that made a
+            use_graphql fetch fall back to REST, otherwise None.
+            
+        Raises:
+            Exception: If repository not found or access denied
         """
         if filters is None:
             filters = {}
         
         try:
-            repo = self.client.get_repo(repo_name)
-            
             # Build API parameters from filters
             api_params = self._build_api_params(filters)
             
             # Handle milestone filter - resolve title to number
             if filters.get('milestone'):
                 milestone_value = filters['milestone']
-                resolved_milestone = self._resolve_milestone(repo, milestone_value)
+                resolved_milestone = self._resolve_milestone(repo_name, milestone_value)
                 
                 if resolved_milestone:
                     # Successfully resolved milestone title to number
@@ -223,40 +575,488 @@ class GitHubClient:
                         f"'none' for no milestone."
                     )
             
-            # Fetch issues with API-level filters
-            issues = repo.get_issues(**api_params)
+            # The API has no upper creation-date bound, so 'until' is applied
+            # here; the listing is then sorted oldest first (see
+            # _build_api_params) and the scan stops at the first issue
+            # created after it instead of paging through the rest
+            until_date = self._parse_until(filters)
             
-            issue_list = []
-            for issue in issues:
-                # Skip pull requests (they appear in issues endpoint)
-                if issue.pull_request:
-                    continue
+            # The oldest-first listing used with 'until' does not surface
+            # updates on its first page, so it is never fetched conditionally
+            listing_url = f"{API_URL}/repos/{repo_name}/issues"
+            
+            graphql_error = None
+            if use_graphql and api_params.get('milestone') != 'none':
+                probe_etag = None
+                if not until_date:
+                    headers = {'If-None-Match': etag} if etag else None
+                    probe = self._rest_get(listing_url, {**api_params, 'per_page': 1}, headers=headers)
+                    if probe.status_code == 304:
+                        return None, etag, None
+                    probe_etag = probe.headers.get('ETag')
+                try:
+                    issues = self._query_issues_graphql(
+                        repo_name, filters, api_params.get('milestone'), until_date, include_comments
+                    )
+                    return issues, probe_etag, None
+                except Exception as e:
+                    graphql_error = e
+                    etag = None  # Fall back to a full REST fetch below
+            
+            first_page = None
+            if not until_date:
+                headers = {'If-None-Match': etag} if etag else None
+                first_page = self._rest_get(listing_url, api_params, headers=headers)
+                if first_page.status_code == 304:
+                    return None, etag, graphql_error
+                etag = first_page.headers.get('ETag')
+            else:
+                etag = None
+            
+            # Fetch issues with API-level filters. Each item is reduced to
+            # the issue data dictionary as soon as its page arrives, so the
+            # full REST objects (user records, reactions, ...) of only one
+            # page are held at a time
+            issues = []
+            # (issue data, comments_url, raw created_at, comment count) of
+            # issues with comments
+            commented = []
+            for item in self._paginate(listing_url, api_params, first_page=first_page):
+                if until_date and self._parse_date_to_aware(item['created_at']) > until_date:
+                    break
                 
-                # Apply client-side filters that API doesn't support
-                if not self._matches_client_filters(issue, filters):
+                # Skip pull requests (they appear in issues endpoint)
+                if 'pull_request' in item:
                     continue
                 
-                issue_data = self._extract_issue_data(issue, include_comments=include_comments)
-                issue_list.append(issue_data)
+                issue_data = self._extract_issue_data_from_dict(item, [])
+                issues.append(issue_data)
+                # Issues whose 'comments' count is zero need no comment request
+                if include_comments and item.get('comments'):
+                    commented.append((issue_data, item['comments_url'], item['created_at'], item['comments']))
             
-            return issue_list
+            if self._use_bulk_comments(filters, commented):
+                # One repository-wide listing instead of a request per issue
+                comments_by_number = self._fetch_all_comments(
+                    repo_name,
+                    since=min(entry[2] for entry in commented),
+                    numbers={entry[0]['number'] for entry in commented},
+                )
+                for issue_data, *_ in commented:
+                    issue_data['comments'] = comments_by_number.get(issue_data['number'], [])
+            elif commented:
+                # Per-issue listings, fetched concurrently
+                with ThreadPoolExecutor(max_workers=COMMENT_FETCH_WORKERS) as executor:
+                    results = executor.map(
+                        lambda entry: self._fetch_comments(entry[1]), commented
+                    )
+                    for (issue_data, *_), comments in zip(commented, results):
+                        issue_data['comments'] = comments
+            
+            return issues, etag, graphql_error
             
-        except GithubException as e:
-            raise Exception(f"Failed to fetch issues from {repo_name}: {str(e)}")
         except Exception as e:
             # Catch any other exceptions and provide context
             raise Exception(f"Error fetching issues from {repo_name}: {str(e)}")
     
+    def _query_issues_graphql(self, repo_name: str, filters: Dict[str, Any], milestone: Optional[str],
+                              until_date: Optional[datetime],
+                              include_comments: bool) -> List[Dict[str, Any]]:
+        """Page through a repository's issues with _ISSUES_QUERY.
+        
+        Returns the same issue dictionaries as the REST listing, but each
+        request carries 100 issues together with their first 100 comments, so
+        most repositories need one request per 100 issues in total. Only
+        issues with more than 100 comments need extra requests.
+        
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            filters: Filter dictionary, see fetch_issues
+            milestone: Milestone number or '*' (from _resolve_milestone), if filtered;
+                'none' has no GraphQL equivalent and must use the REST listing
+            until_date: Upper creation-date bound from _parse_until, if any
+            include_comments: Whether to fetch comments for each issue
+            
+        Returns:
+            List of issue dictionaries with all relevant data
+        """
+        owner, name = repo_name.split('/', 1)
+        
+        filter_by: Dict[str, Any] = {}
+        state = filters.get('state', 'all')
+        if state in ('open', 'closed'):
+            filter_by['states'] = [state.upper()]
+        if filters.get('author'):
+            filter_by['createdBy'] = filters['author']
+        if filters.get('assignee'):
+            filter_by['assignee'] = filters['assignee']
+        if milestone:
+            filter_by['milestoneNumber'] = milestone
+        
+        # GraphQL matches issues with any of the labels; the REST listing
+        # (and so the filter's meaning) requires all of them
+        labels = filters.get('labels') or []
+        if isinstance(labels, str):
+            labels = labels.split(',')
+        labels = [label.strip() for label in labels if label.strip()]
+        if labels:
+            filter_by['labels'] = labels
+        wanted_labels = {label.lower() for label in labels}
+        
+        if filters.get('since'):
+            try:
+                since = self._parse_date_to_aware(filters['since'])
+                filter_by['since'] = since.strftime('%Y-%m-%dT%H:%M:%SZ')
+            except (ValueError, AttributeError):
+                pass  # Invalid date format, skip filter
+        
+        # Same ordering as the REST listing (see _build_api_params)
+        if until_date:
+            order_by = {'field': 'CREATED_AT', 'direction': 'ASC'}
+        else:
+            order_by = {'field': 'UPDATED_AT', 'direction': 'DESC'}
+        
+        variables = {
+            'owner': owner,
+            'name': name,
+            'cursor': None,
+            'filterBy': filter_by,
+            'orderBy': order_by,
+            'withComments': include_comments,
+        }
+        
+        issues = []
+        while True:
+            connection = self._graphql(_ISSUES_QUERY, variables)['repository']['issues']
+            
+            for node in connection['nodes']:
+                if until_date and self._parse_date_to_aware(node['createdAt']) > until_date:
+                    return issues
+                
+                if wanted_labels and not wanted_labels <= {
+                        label['name'].lower() for label in node['labels']['nodes']}:
+                    continue
+                
+                comments = []
+                if include_comments:
+                    comments = [self._extract_comment_data_from_node(c) for c in node['comments']['nodes']]
+                    page_info = node['comments']['pageInfo']
+                    if page_info['hasNextPage']:
+                        comments.extend(self._query_more_comments_graphql(
+                            owner, name, node['number'], page_info['endCursor']
+                        ))
+                
+                issues.append(self._extract_issue_data_from_node(node, comments))
+            
+            page_info = connection['pageInfo']
+            if not page_info['hasNextPage']:
+                return issues
+            variables['cursor'] = page_info['endCursor']
+    
+    def _query_more_comments_graphql(self, owner: str, name: str, number: int,
+                                     cursor: str) -> List[Dict[str, Any]]:
+        """Fetch the comments of an issue that follow a GraphQL cursor.
+        
+        Args:
+            owner: Repository owner
+            name: Repository name
+            number: Issue number
+            cursor: endCursor of the comments already fetched
+            
+        Returns:
+            List of comment dictionaries in creation order
+        """
+        comments = []
+        variables = {'owner': owner, 'name': name, 'number': number, 'cursor': cursor}
+        while True:
+            connection = self._graphql(_ISSUE_COMMENTS_QUERY, variables)['repository']['issue']['comments']
+            comments.extend(self._extract_comment_data_from_node(c) for c in connection['nodes'])
+            if not connection['pageInfo']['hasNextPage']:
+                return comments
+            variables['cursor'] = connection['pageInfo']['endCursor']
+    
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a GraphQL query with the next token of the rotation pool.
+        
+        Goes through _request, so the GraphQL quota is tracked per token and
+        rate-limit rejections are retried like REST ones. GitHub reports an
+        exhausted GraphQL quota as a RATE_LIMITED error in a 200 response;
+        that is retried too, with _pick_token skipping or waiting for the
+        token.
+        
+        Args:
+            query: GraphQL query text
+            variables: Query variables
+            
+        Returns:
+            The response's 'data' object
+            
+        Raises:
+            Exception: On HTTP errors or when the response contains errors
+        """
+        for attempt in range(RETRY_TOTAL + 1):
+            response = self._request('POST', GRAPHQL_URL, 'graphql', timeout=60,
+                                     json={'query': query, 'variables': variables})
+            data = orjson.loads(response.content)
+            errors = data.get('errors')
+            if not errors:
+                return data['data']
+            if attempt < RETRY_TOTAL and any(e.get('type') == 'RATE_LIMITED' for e in errors):
+                continue
+            messages = '; '.join(e.get('message', str(e)) for e in errors)
+            raise Exception(f"GraphQL error: {messages}")
+    
+    def _rest_get(self, url: str, params: Optional[Dict[str, Any]] = None,
+                  headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """Issue a GET request against the REST API.
+
+        Args:
+            url: Absolute API URL
+            params: Optional query parameters
+            headers: Optional extra request headers
+
+        Returns:
+            The successful (2xx or 304) response
+
+        Raises:
+            Exception: If GitHub returns an error status
+        """
+        return self._request('GET', url, 'core', params=params, headers=headers, timeout=30)
+    
+    def _request(self, method: str, url: str, resource: str,
+                 headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
+        """Send an API request, handling token rotation and rate limits.
+
+        Each request uses the next token of the rotation pool that still has
+        quota for the resource, and the response's rate-limit headers are
+        recorded for it. At most MAX_CONCURRENT_REQUESTS requests are in
+        flight at once, however many threads call this, which keeps clear of
+        GitHub's secondary limits on concurrency. Transient server errors on
+        GETs are retried by the session's adapter; rate-limit rejections are
+        retried here, up to RETRY_TOTAL times:
+
+        - primary limit (X-RateLimit-Remaining: 0): the token is marked as
+          exhausted, so the retry uses another token or waits for the reset
+        - secondary limit: waits for Retry-After if given, otherwise
+          SECONDARY_RATE_LIMIT_WAIT seconds, doubling on each further hit
+
+        Every token is expected to read every tracked repository, but a
+        token without access to a private repository gets a 404 for it. So
+        a 404 is retried with each other token before it is reported, which
+        keeps one such token from failing random pages of a listing.
+
+        Args:
+            method: HTTP method
+            url: Absolute API URL
+            resource: Rate-limit resource the request counts against
+                ('core' or 'graphql')
+            headers: Optional extra request headers
+            **kwargs: Passed on to requests.Session.request
+
+        Returns:
+            The successful (2xx or 304) response
+
+        Raises:
+            Exception: If GitHub returns an error status
+        """
+        secondary_wait = SECONDARY_RATE_LIMIT_WAIT
+        not_found = set()  # Tokens that got a 404 for this request
+        attempt = 0
+        
+        while True:
+            state = self._pick_token(resource, exclude=not_found)
+            with self._request_slots:
+                response = self._session.request(
+                    method, url,
+                    headers={**(headers or {}), 'Authorization': f'Bearer {state.token}'},
+                    **kwargs,
+                )
+            
+            remaining = response.headers.get('X-RateLimit-Remaining')
+            reset = response.headers.get('X-RateLimit-Reset')
+            if remaining and reset:
+                with self._tokens_lock:
+                    state.remaining[resource] = int(remaining)
+                    state.reset_at[resource] = float(reset)
+            
+            if response.status_code == 404 and len(not_found) + 1 < len(self._tokens):
+                not_found.add(state.token)
+                continue
+            
+            if response.ok or response.status_code not in (403, 429) or attempt == RETRY_TOTAL:
+                break
+            attempt += 1
+            
+            if remaining == '0':
+                # Primary limit: _pick_token now skips or waits for this token
+                continue
+            
+            retry_after = response.headers.get('Retry-After')
+            if retry_after is None and 'secondary rate limit' not in response.text.lower():
+                break  # A real permission error
+            
+            if retry_after is not None and retry_after.isdigit():
+                time.sleep(int(retry_after))
+            else:
+                time.sleep(secondary_wait)
+                secondary_wait *= 2
+        
+        if not response.ok:
+            try:
+                message = response.json().get('message', response.reason)
+            except ValueError:
+                message = response.reason
+            raise Exception(f"{response.status_code} {message}")
+        
+        return response
+    
+    def _pick_token(self, resource: str = 'core', exclude: Set[str] = frozenset()) -> _TokenState:
+        """Return the next token with quota left, rotating round-robin.
+
+        A token is skipped while it has fewer than RATE_LIMIT_THRESHOLD
+        requests of the resource left and its window has not reset yet. When
+        every token is in that state, sleeps until the earliest reset.
+
+        Args:
+            resource: Rate-limit resource the request counts against
+            exclude: Tokens not to use; must leave at least one token
+
+        Returns:
+            The token state to use for the next request
+        """
+        while True:
+            with self._tokens_lock:
+                now = time.time()
+                for _ in range(len(self._tokens)):
+                    state = self._tokens[0]
+                    self._tokens.rotate(-1)
+                    if state.token in exclude:
+                        continue
+                    remaining = state.remaining.get(resource)
+                    if (remaining is None or remaining >= RATE_LIMIT_THRESHOLD
+                            or state.reset_at.get(resource, 0.0) <= now):
+                        return state
+                wait = min(state.reset_at.get(resource, 0.0) for state in self._tokens
+                           if state.token not in exclude) - now
+            time.sleep(max(0.0, wait) + 1)
+    
+    def _paginate(self, url: str, params: Optional[Dict[str, Any]] = None,
+                  first_page: Optional[requests.Response] = None) -> Iterator[Dict[str, Any]]:
+        """Yield every item of a paginated REST listing.
+
+        Follows the Link: rel="next" header until the last page.
+
+        Args:
+            url: Absolute API URL of the first page
+            params: Optional query parameters for the first page
+            first_page: Response for the first page, if already fetched
+
+        Yields:
+            JSON objects of the listing, in API order
+        """
+        while url:
+            if first_page is not None:
+                response, first_page = first_page, None
+            else:
+                response = self._rest_get(url, params)
+            yield from orjson.loads(response.content)
+            url = response.links.get('next', {}).get('url')
+            params = None  # The next-page URL already carries the query
+    
+    def _fetch_comments(self, comments_url: str) -> List[Dict[str, Any]]:
+        """Fetch all comments of one issue.
+
+        Args:
+            comments_url: The issue's 'comments_url' from the REST API
+
+        Returns:
+            List of comment dictionaries in creation order
+        """
+        return [
+            self._extract_comment_data(comment)
+            for comment in self._paginate(comments_url, {'per_page': 100})
+        ]
+    
+    def _use_bulk_comments(self, filters: Dict[str, Any], commented: List[Tuple]) -> bool:
+        """Decide whether to read comments from the repository-wide listing.
+        
+        The repository-wide listing returns every comment in the repository
+        since a date, pull request comments included, so it is only cheaper
+        when the issues listing covered the whole repository. With any
+        narrowing filter it may download far more comments than are wanted,
+        so per-issue requests are used. Otherwise the bulk listing is used
+        once per-issue fetching would take more than BULK_COMMENTS_MIN_REQUESTS
+        requests, estimated from each issue's comment count.
+        
+        Args:
+            filters: Filter dictionary the issues were listed with
+            commented: (issue data, comments_url, created_at, comment count)
+                of the listed issues with comments
+            
+        Returns:
+            True to use _fetch_all_comments, False for per-issue requests
+        """
+        if filters.get('state', 'all') != 'all' or any(
+                filters.get(key) for key in ('author', 'assignee', 'labels', 'milestone', 'since', 'until')):
+            return False
+        # One request per started 100 comments of each issue
+        per_issue_requests = sum(-(-count // 100) for *_, count in commented)
+        return per_issue_requests > BULK_COMMENTS_MIN_REQUESTS
+    
+    def _fetch_all_comments(self, repo_name: str, since: str,
+                            numbers: Set[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """Fetch the comments of many issues with one repository-wide listing.
+
+        GET /repos/{owner}/{repo}/issues/comments returns every comment in the
+        repository, so N per-issue requests collapse into one request per 100
+        comments. A comment cannot predate its issue, so passing the oldest
+        wanted issue's creation time as 'since' is a safe lower bound.
+
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            since: ISO 8601 timestamp; comments last updated before it are skipped
+            numbers: Issue numbers whose comments are wanted
+
+        Returns:
+            Dict mapping issue number to its comments in creation order
+        """
+        comments_by_number: Dict[int, List[Dict[str, Any]]] = {}
+        params = {'sort': 'created', 'direction': 'asc', 'since': since, 'per_page': 100}
+        
+        for comment in self._paginate(f"{API_URL}/repos/{repo_name}/issues/comments", params):
+            number = int(comment['issue_url'].rsplit('/', 1)[-1])
+            if number in numbers:
+                comments_by_number.setdefault(number, []).append(self._extract_comment_data(comment))
+        
+        return comments_by_number
+    
+    @staticmethod
+    def _extract_comment_data(comment: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a REST API comment object onto the comment dictionary.
+
+        Args:
+            comment: Comment JSON object from the REST API
+
+        Returns:
+            Dictionary with author, body, created_at and updated_at
+        """
+        return {
+            'author': (comment.get('user') or {}).get('login', 'ghost'),
+            'body': comment.get('body') or '',
+            'created_at': _normalize_timestamp(comment['created_at']),
+            'updated_at': _normalize_timestamp(comment['updated_at']),
+        }
+    
     def _build_api_params(self, filters: Dict[str, Any]) -> Dict[str, Any]:
-        """Build PyGithub API parameters from filter dictionary.
+        """Build REST query parameters for the issues listing from a filter dictionary.
         
         Args:
             filters: Filter dictionary
             
         Returns:
-            Dictionary of API parameters for get_issues()
+            Dictionary of query parameters for GET /repos/{owner}/{repo}/issues
         """
-        params = {}
+        params: Dict[str, Any] = {'per_page': 100}
         
         # State filter (API supports this)
         state = filters.get('state', 'all')
@@ -277,32 +1077,43 @@ class GitHubClient:
         # Labels filter (API supports this)
         if filters.get('labels'):
             labels = filters['labels']
-            if isinstance(labels, str):
-                labels = [l.strip() for l in labels.split(',')]
+            if isinstance(labels, list):
+                labels = ','.join(l.strip() for l in labels)
             params['labels'] = labels
         
+        # Until filter is applied client-side; listing oldest first lets
+        # fetch_issues stop at the first issue past the bound. Otherwise list
+        # most recently updated first, so any change lands on the first page
+        # (see fetch_issues_if_changed)
+        if self._parse_until(filters):
+            params['sort'] = 'created'
+            params['direction'] = 'asc'
+        else:
+            params['sort'] = 'updated'
+            params['direction'] = 'desc'
+        
         # Since filter (API supports this)
         if filters.get('since'):
             try:
-                params['since'] = self._parse_date_to_aware(filters['since'])
+                since = self._parse_date_to_aware(filters['since'])
+                params['since'] = since.strftime('%Y-%m-%dT%H:%M:%SZ')
             except (ValueError, AttributeError):
                 pass  # Invalid date format, skip filter
         
         return params
     
-    def _resolve_milestone(self, repo, milestone_value: str):
-        """Resolve milestone title to Milestone object or special value.
+    def _resolve_milestone(self, repo_name: str, milestone_value: str) -> Optional[str]:
+        """Resolve a milestone title to the value the issues listing expects.
         
-        PyGithub's get_issues() expects either a Milestone object or special values
-        ('*' for any milestone, 'none' for no milestone), but users enter titles.
-        This method converts a milestone title to the corresponding Milestone object.
+        The REST API filters by milestone number or by the special values
+        '*' (any milestone) and 'none' (no milestone), but users enter titles.
         
         Args:
-            repo: PyGithub Repository object
+            repo_name: Repository name in format 'owner/repo'
             milestone_value: Milestone title, '*', or 'none'
             
         Returns:
-            Milestone object, '*', 'none', or None if not found
+            Milestone number as a string, '*', 'none', or None if not found
         """
         # Handle special values
         if milestone_value in ['*', 'none']:
@@ -310,40 +1121,33 @@ class GitHubClient:
         
         try:
             # Fetch all milestones (both open and closed)
-            for milestone in repo.get_milestones(state='all'):
-                if milestone.title == milestone_value:
-                    # Return the Milestone object itself
-                    return milestone
+            url = f"{API_URL}/repos/{repo_name}/milestones"
+            for milestone in self._paginate(url, {'state': 'all', 'per_page': 100}):
+                if milestone['title'] == milestone_value:
+                    return str(milestone['number'])
             
             # Milestone not found
             return None
             
-        except GithubException:
+        except Exception:
             # If we can't fetch milestones, return None
             return None
     
-    def _matches_client_filters(self, issue, filters: Dict[str, Any]) -> bool:
-        """Check if issue matches client-side filters.
-        
-        Some filters need to be applied client-side because the API doesn't support them.
+    def _parse_until(self, filters: Dict[str, Any]) -> Optional[datetime]:
+        """Return the 'until' filter as an aware datetime.
         
         Args:
-            issue: PyGithub Issue object
             filters: Filter dictionary
             
         Returns:
-            True if issue matches all client-side filters
+            The end of the creation-date range, or None if unset or invalid
         """
-        # Until date filter (not supported by API)
-        if filters.get('until'):
-            try:
-                until_date = self._parse_date_to_aware(filters['until'])
-                if issue.created_at > until_date:
-                    return False
-            except (ValueError, AttributeError):
-                pass  # Invalid date format, skip filter
-        
-        return True
+        if not filters.get('until'):
+            return None
+        try:
+            return self._parse_date_to_aware(filters['until'])
+        except (ValueError, AttributeError):
+            return None  # Invalid date format, skip filter
     
     def get_issue(self, repo_name: str, issue_number: int,
                   include_comments: bool = False) -> Dict[str, Any]:
@@ -489,3 +1293,97 @@ class GitHubClient:
         
         return issue_data
 
+    @staticmethod
+    def _graphql_login(actor: Optional[Dict[str, Any]]) -> str:
+        """Return an author's login as the REST API reports it.
+        
+        GraphQL gives apps their bare name ('dependabot') where REST has
+        'dependabot[bot]'; deleted accounts are null in both (-> 'ghost').
+        """
+        if not actor:
+            return 'ghost'
+        if actor.get('__typename') == 'Bot':
+            return f"{actor['login']}[bot]"
+        return actor['login']
+    
+    @classmethod
+    def _extract_comment_data_from_node(cls, comment: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a GraphQL IssueComment node onto the comment dictionary.
+        
+        Args:
+            comment: Node selected by the CommentFields fragment
+            
+        Returns:
+            Dictionary with author, body, created_at and updated_at
+        """
+        return {
+            'author': cls._graphql_login(comment.get('author')),
+            'body': comment.get('body') or '',
+            'created_at': _normalize_timestamp(comment['createdAt']),
+            'updated_at': _normalize_timestamp(comment['updatedAt']),
+        }
+    
+    def _extract_issue_data_from_node(self, issue: Dict[str, Any],
+                                      comments: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Map a GraphQL Issue node onto the issue data dictionary.
+        
+        Produces the same shape (and values) as _extract_issue_data_from_dict,
+        so switching between the REST and GraphQL fetch does not change any
+        stored hash.
+        
+        Args:
+            issue: Issue node from _ISSUES_QUERY
+            comments: Already-fetched comment dictionaries for the issue
+            
+        Returns:
+            Dictionary containing all issue data
+        """
+        milestone = issue.get('milestone')
+        return {
+            'number': issue['number'],
+            'title': issue.get('title') or '',
+            'body': issue.get('body') or '',
+            'state': issue['state'].lower(),
+            'status': None,
+            'labels': [label['name'] for label in issue['labels']['nodes']],
+            'author': self._graphql_login(issue.get('author')),
+            'assignees': [assignee['login'] for assignee in issue['assignees']['nodes']],
+            'created_at': _normalize_timestamp(issue['createdAt']),
+            'updated_at': _normalize_timestamp(issue['updatedAt']),
+            'closed_at': _normalize_timestamp(issue.get('closedAt')),
+            'url': issue['url'],
+            'comments': comments,
+            'milestone': milestone['title'] if milestone else None,
+        }
+    
+    def _extract_issue_data_from_dict(self, issue: Dict[str, Any],
+                                      comments: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Map a REST API issue object onto the issue data dictionary.
+
+        Produces the same shape (and timestamp format) as _extract_issue_data
+        without building a PyGithub object per issue.
+
+        Args:
+            issue: Issue JSON object from the REST API
+            comments: Already-fetched comment dictionaries for the issue
+
+        Returns:
+            Dictionary containing all issue data
+        """
+        milestone = issue.get('milestone')
+        return {
+            'number': issue['number'],
+            'title': issue.get('title') or '',
+            'body': issue.get('body') or '',
+            'state': issue['state'],
+            'status': None,
+            'labels': [label['name'] for label in issue.get('labels') or []],
+            'author': (issue.get('user') or {}).get('login', 'ghost'),
+            'assignees': [assignee['login'] for assignee in issue.get('assignees') or []],
+            'created_at': _normalize_timestamp(issue['created_at']),
+            'updated_at': _normalize_timestamp(issue['updated_at']),
+            'closed_at': _normalize_timestamp(issue.get('closed_at')),
+            'url': issue['html_url'],
+            'comments': comments,
+            'milestone': milestone['title'] if milestone else None,
+        }
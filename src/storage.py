@@ -1,12 +1,59 @@
 """Storage layer for managing issue markdown files and metadata."""
 
+import io
 import os
-import json
 import hashlib
-import yaml
+import orjson
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from dotenv import load_dotenv
+from typing import Dict, Any, Optional, List, Iterable, Iterator, Tuple
+
+# PyYAML and python-dotenv are imported where they are used, so commands that
+# only read metadata (e.g. 'status') do not load them
+
+# Threads rendering and writing issue files in save_issues
+SAVE_WORKERS = 16
+
+
+@lru_cache(maxsize=None)
+def yaml_classes():
+    """Return the safe YAML (Loader, Dumper) pair, preferring libyaml.
+
+    PyYAML only uses its C implementation when asked for it explicitly and
+    when it was built against libyaml; otherwise the pure-Python classes,
+    which produce identical results, are used.
+
+    Returns:
+        Tuple of (loader class, dumper class)
+    """
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+    return loader, dumper
+
+
+class _HashingWriter:
+    """Text stream wrapper that SHA-256 hashes everything written through it.
+    
+    With no underlying stream, it only hashes.
+    """
+    
+    def __init__(self, fh=None):
+        self._fh = fh
+        self._hash = hashlib.sha256()
+    
+    def write(self, text: str):
+        self._hash.update(text.encode('utf-8'))
+        if self._fh is not None:
+            self._fh.write(text)
+    
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
 
 
 class IssueStorage:
@@ -19,12 +66,20 @@ class IssueStorage:
             base_dir: Base directory for storing issue files. If None, defaults to
                      the 'issues' subfolder at the repository root.
         """
+        from dotenv import load_dotenv
+
         load_dotenv()
         if base_dir is None:
             base_dir = self._get_default_base_dir()
         
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Metadata of repositories inside a batch() block, written on exit
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        
+        # Repository directories already created by get_repo_dir
+        self._known_dirs = set()
     
     def _get_default_base_dir(self) -> str:
         """Get the base directory for issue storage.
@@ -49,9 +104,35 @@ class IssueStorage:
         # Convert owner/repo to owner-repo for directory name
         repo_dir_name = repo_name.replace('/', '-')
         repo_dir = self.base_dir / repo_dir_name
-        repo_dir.mkdir(exist_ok=True)
+        if repo_dir not in self._known_dirs:
+            repo_dir.mkdir(exist_ok=True)
+            self._known_dirs.add(repo_dir)
         return repo_dir
     
+    @contextmanager
+    def batch(self, repo_name: str) -> Iterator[None]:
+        """Defer metadata writes for a repository until the block exits.
+        
+        Inside the block, load_metadata returns one shared in-memory copy and
+        every metadata update (saving or deleting issues, filters, the listing
+        ETag) mutates it instead of rewriting .metadata.json. On exit, also on
+        error or Ctrl-C, the file is written once, atomically, so it always
+        matches the issue files written so far. Nested blocks for the same
+        repository join the outer one.
+        
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+        """
+        if repo_name in self._pending:
+            yield
+            return
+        
+        self._pending[repo_name] = self.load_metadata(repo_name)
+        try:
+            yield
+        finally:
+            self._write_metadata_file(repo_name, self._pending.pop(repo_name))
+    
     def save_issue(self, repo_name: str, issue_data: Dict[str, Any]) -> str:
         """Save an issue as a markdown file.
         
@@ -62,24 +143,83 @@ class IssueStorage:
         Returns:
             Path to the saved markdown file
         """
+        file_path, file_hash = self._write_issue_file(repo_name, issue_data)
+        
+        # Update metadata
+        self._update_metadata(repo_name, issue_data, file_hash=file_hash)
+        
+        return file_path
+    
+    def save_issues(self, repo_name: str, issues: Iterable[Dict[str, Any]],
+                    rendered: Optional[Dict[int, str]] = None) -> List[str]:
+        """Save several issues of one repository as markdown files.
+
+        Equivalent to calling save_issue for each issue inside a batch(), so
+        the metadata file is read once and written once for the whole batch
+        instead of once per issue. Files are rendered and written by up to
+        SAVE_WORKERS threads, while metadata is updated on the calling thread
+        in input order. Issues are consumed lazily, at most a few per worker
+        ahead of the finished writes, so a progress-bar iterator can be
+        passed straight through.
+
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            issues: Iterable of issue data dictionaries
+            rendered: Optional dict mapping issue numbers to markdown already
+                rendered for them (see ChangeTracker.detect_changes); those
+                issues are written without being rendered again
+
+        Returns:
+            Paths to the saved markdown files
+        """
+        saved = []
+        in_flight = deque()
+        rendered = rendered or {}
+        
+        def finish_oldest():
+            issue_data, future = in_flight.popleft()
+            file_path, file_hash = future.result()
+            self._apply_issue_metadata(self.load_metadata(repo_name), issue_data, file_hash=file_hash)
+            saved.append(file_path)
+        
+        with self.batch(repo_name), ThreadPoolExecutor(max_workers=SAVE_WORKERS) as executor:
+            for issue_data in issues:
+                future = executor.submit(self._write_issue_file, repo_name, issue_data,
+                                         rendered.get(issue_data['number']))
+                in_flight.append((issue_data, future))
+                if len(in_flight) >= 2 * SAVE_WORKERS:
+                    finish_oldest()
+            while in_flight:
+                finish_oldest()
+        
+        return saved
+    
+    def _write_issue_file(self, repo_name: str, issue_data: Dict[str, Any],
+                          markdown: Optional[str] = None) -> Tuple[str, str]:
+        """Write the markdown file for an issue.
+
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            issue_data: Dictionary containing issue data
+            markdown: The issue's markdown, if already rendered
+
+        Returns:
+            Tuple of (path to the markdown file, SHA-256 hash of its content)
+        """
         repo_dir = self.get_repo_dir(repo_name)
         issue_number = issue_data['number']
         file_path = repo_dir / f"issue-{issue_number}.md"
         
-        # Generate markdown content
-        markdown_content = self._generate_markdown(issue_data)
-        
-        # Write to file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
-        
-        # Compute file hash for local-edit detection
-        file_hash = hashlib.sha256(markdown_content.encode('utf-8')).hexdigest()
+        # Stream the markdown to the file, hashing it on the way for
+        # local-edit detection
+        with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            writer = _HashingWriter(f)
+            if markdown is not None:
+                writer.write(markdown)
+            else:
+                self._write_markdown(writer, issue_data)
         
-        # Update metadata
-        self._update_metadata(repo_name, issue_data, file_hash=file_hash)
-        
-        return str(file_path)
+        return str(file_path), writer.hexdigest()
     
     def _generate_markdown(self, issue_data: Dict[str, Any]) -> str:
         """Generate markdown content from issue data.
@@ -90,6 +230,20 @@ class IssueStorage:
         Returns:
             Markdown formatted string
         """
+        buf = io.StringIO()
+        self._write_markdown(buf, issue_data)
+        return buf.getvalue()
+    
+    def _write_markdown(self, fh, issue_data: Dict[str, Any]):
+        """Write the markdown for an issue piece by piece to a text stream.
+        
+        Bodies and comments are written as they are, so no copy of the whole
+        document is ever built in memory.
+        
+        Args:
+            fh: Object with a write(str) method, e.g. an open text file
+            issue_data: Dictionary containing issue data
+        """
         # Create YAML frontmatter
         frontmatter = {
             'number': issue_data['number'],
@@ -112,31 +266,52 @@ class IssueStorage:
         if issue_data.get('milestone'):
             frontmatter['milestone'] = issue_data['milestone']
         
-        # Build markdown content
-        lines = ['---']
-        lines.append(yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True).strip())
-        lines.append('---')
-        lines.append('')
-        lines.append(f"# {issue_data['title']}")
-        lines.append('')
+        fh.write('---\n')
+        fh.write(self._dump_frontmatter(frontmatter).strip())
+        fh.write('\n---\n\n# ')
+        fh.write(issue_data['title'])
+        fh.write('\n')
         
         # Add issue body
         if issue_data['body']:
-            lines.append(issue_data['body'])
-            lines.append('')
+            fh.write('\n')
+            fh.write(issue_data['body'])
+            fh.write('\n')
         
         # Add comments section
         if issue_data['comments']:
-            lines.append('## Comments')
-            lines.append('')
+            fh.write('\n## Comments\n')
             
             for comment in issue_data['comments']:
-                lines.append(f"### Comment by {comment['author']} on {comment['created_at']}")
-                lines.append('')
-                lines.append(comment['body'])
-                lines.append('')
+                fh.write(f"\n### Comment by {comment['author']} on {comment['created_at']}\n\n")
+                fh.write(comment['body'])
+                fh.write('\n')
+    
+    @staticmethod
+    def _dump_frontmatter(frontmatter: Dict[str, Any]) -> str:
+        """Serialize issue frontmatter to YAML, using libyaml when possible.
         
-        return '\n'.join(lines)
+        libyaml escapes characters outside the Basic Multilingual Plane (such
+        as emoji) even with allow_unicode, so frontmatter containing any is
+        dumped with the pure-Python emitter to keep the files readable.
+        
+        Args:
+            frontmatter: Frontmatter dictionary
+            
+        Returns:
+            YAML text
+        """
+        import yaml
+
+        _, dumper = yaml_classes()
+        text = ''.join(
+            ''.join(map(str, value)) if isinstance(value, list) else str(value)
+            for value in frontmatter.values()
+        )
+        if text and max(text) > '\uffff':
+            dumper = yaml.SafeDumper
+        return yaml.dump(frontmatter, Dumper=dumper, default_flow_style=False, allow_unicode=True,
+                         sort_keys=False)
     
     def _update_metadata(self, repo_name: str, issue_data: Dict[str, Any], file_hash: Optional[str] = None):
         """Update metadata file with issue hash for change detection.
@@ -145,62 +320,117 @@ class IssueStorage:
             repo_name: Repository name in format 'owner/repo'
             issue_data: Dictionary containing issue data
         """
-        repo_dir = self.get_repo_dir(repo_name)
-        metadata_file = repo_dir / '.metadata.json'
-        
         # Load existing metadata via the safe loader (handles corrupt JSON)
         metadata = self.load_metadata(repo_name)
+        self._apply_issue_metadata(metadata, issue_data, file_hash=file_hash)
+        self._write_metadata(repo_name, metadata)
+    
+    def _apply_issue_metadata(self, metadata: Dict[str, Any], issue_data: Dict[str, Any],
+                              file_hash: Optional[str] = None):
+        """Record an issue's change-detection fields in a loaded metadata dict.
         
-        # Calculate hash of issue data
-        issue_hash = self._calculate_hash(issue_data)
+        Args:
+            metadata: Metadata dictionary as returned by load_metadata (mutated)
+            issue_data: Dictionary containing issue data
+            file_hash: SHA-256 hash of the issue's markdown file, if known
+        """
+        # The content hash is the hash of the rendered file, so when the file
+        # was just written its hash is reused instead of computed again
+        issue_hash = file_hash if file_hash is not None else self._calculate_hash(issue_data)
         
         # Merge into the existing record so that fields added by other code
         # paths (e.g. file_hash) are not silently erased.
         issue_number = str(issue_data['number'])
         existing = metadata['issues'].get(issue_number, {})
         existing['hash'] = issue_hash
-        existing['updated_at'] = issue_data['updated_at']
         existing['state'] = issue_data['state']
+        existing.update(self._quick_check_fields(issue_data))
         if file_hash is not None:
             existing['file_hash'] = file_hash
         metadata['issues'][issue_number] = existing
+    
+    @staticmethod
+    def _quick_check_fields(issue_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the fields that tell cheaply whether an issue may have changed.
         
-        # Save metadata
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
+        ChangeTracker compares these with the stored values before hashing
+        the whole issue: GitHub's updated_at, the project status (which does
+        not bump updated_at), the number of comments and the latest comment
+        edit time.
+        
+        Args:
+            issue_data: Dictionary containing issue data
+            
+        Returns:
+            Dictionary of the fields, as stored in the issue's metadata entry
+        """
+        comments = issue_data['comments']
+        return {
+            'updated_at': issue_data['updated_at'],
+            'status': issue_data.get('status'),
+            'comments_count': len(comments),
+            'last_comment_updated_at': max((c.get('updated_at') or '' for c in comments), default=None),
+        }
+    
+    def _write_metadata(self, repo_name: str, metadata: Dict[str, Any]):
+        """Write a repository's metadata dictionary to its .metadata.json file.
+        
+        Inside a batch() block for the repository, the write is deferred to
+        the end of the block.
+        
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            metadata: Metadata dictionary to save
+        """
+        if repo_name in self._pending:
+            self._pending[repo_name] = metadata
+            return
+        self._write_metadata_file(repo_name, metadata)
+    
+    def _write_metadata_file(self, repo_name: str, metadata: Dict[str, Any]):
+        """Atomically replace a repository's .metadata.json file.
+        
+        The data goes to a temporary file that is then renamed over the old
+        one, so an interrupted write never leaves a truncated file behind.
+        
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            metadata: Metadata dictionary to save
+        """
+        metadata_file = self.get_repo_dir(repo_name) / '.metadata.json'
+        tmp_file = metadata_file.with_name('.metadata.json.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+        os.replace(tmp_file, metadata_file)
     
     def _calculate_hash(self, issue_data: Dict[str, Any]) -> str:
         """Calculate SHA256 hash of issue data for change detection.
         
+        This is the hash of the markdown the issue renders to, i.e. the
+        file_hash it would get if saved now, computed without writing or
+        keeping the markdown.
+        
         Args:
             issue_data: Dictionary containing issue data
             
         Returns:
             SHA256 hash string
         """
-        # Create a normalized string representation of the issue
-        hash_data = {
-            'number': issue_data['number'],
-            'title': issue_data['title'],
-            'body': issue_data['body'],
-            'state': issue_data['state'],
-            'status': issue_data.get('status'),
-            'labels': sorted(issue_data['labels']),
-            'assignees': sorted(issue_data['assignees']),
-            'updated_at': issue_data['updated_at'],
-            'comments': [
-                {
-                    'author': c['author'],
-                    'body': c['body'],
-                    'created_at': c['created_at']
-                }
-                for c in issue_data['comments']
-            ]
-        }
+        writer = _HashingWriter()
+        self._write_markdown(writer, issue_data)
+        return writer.hexdigest()
+    
+    def _render_issue(self, issue_data: Dict[str, Any]) -> Tuple[str, str]:
+        """Render an issue's markdown and compute its content hash together.
         
-        # Convert to JSON string and hash
-        json_str = json.dumps(hash_data, sort_keys=True)
-        return hashlib.sha256(json_str.encode('utf-8')).hexdigest()
+        Args:
+            issue_data: Dictionary containing issue data
+            
+        Returns:
+            Tuple of (markdown, SHA256 hash string as from _calculate_hash)
+        """
+        markdown = self._generate_markdown(issue_data)
+        return markdown, hashlib.sha256(markdown.encode('utf-8')).hexdigest()
     
     def load_metadata(self, repo_name: str) -> Dict[str, Any]:
         """Load metadata for a repository.
@@ -211,16 +441,19 @@ class IssueStorage:
         Returns:
             Metadata dictionary with structure: {'filters': {...}, 'issues': {...}}
         """
+        if repo_name in self._pending:
+            return self._pending[repo_name]
+        
         repo_dir = self.get_repo_dir(repo_name)
         metadata_file = repo_dir / '.metadata.json'
         
         if not metadata_file.exists():
             return {'filters': {}, 'issues': {}}
         
-        with open(metadata_file, 'r', encoding='utf-8') as f:
+        with open(metadata_file, 'rb') as f:
             try:
-                metadata = json.load(f)
-            except (json.JSONDecodeError, ValueError):
+                metadata = orjson.loads(f.read())
+            except orjson.JSONDecodeError:
                 import click
                 click.echo(
                     f"Warning: metadata for '{repo_name}' is corrupt and has been reset. "
@@ -248,9 +481,6 @@ class IssueStorage:
             repo_name: Repository name in format 'owner/repo'
             filters: Dictionary of filter parameters
         """
-        repo_dir = self.get_repo_dir(repo_name)
-        metadata_file = repo_dir / '.metadata.json'
-        
         # Load existing metadata
         metadata = self.load_metadata(repo_name)
         
@@ -258,8 +488,7 @@ class IssueStorage:
         metadata['filters'] = filters
         
         # Save metadata
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
+        self._write_metadata(repo_name, metadata)
     
     def load_filters(self, repo_name: str) -> Dict[str, Any]:
         """Load filter configuration for a repository.
@@ -273,6 +502,44 @@ class IssueStorage:
         metadata = self.load_metadata(repo_name)
         return metadata.get('filters', {})
     
+    def load_listing_etag(self, repo_name: str) -> Optional[str]:
+        """Load the ETag of the last issues listing fetched for a repository.
+        
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            
+        Returns:
+            The stored ETag, or None if there is none
+        """
+        return self.load_metadata(repo_name).get('listing_etag')
+    
+    def save_listing_etag(self, repo_name: str, etag: Optional[str],
+                          issues: Optional[List[Dict[str, Any]]] = None):
+        """Save the ETag of the issues listing the local files now reflect.
+        
+        The time of the save is stored alongside as listing_fetched_at, so
+        callers can stop trusting the ETag once the full listing is too old.
+        
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            etag: ETag from GitHubClient.fetch_issues_if_changed, or None to clear it
+            issues: Issues of that listing; their quick-check fields (project
+                status, comment count, ...) are recorded too, including for
+                issues that were unchanged and so not saved again
+        """
+        metadata = self.load_metadata(repo_name)
+        for issue_data in issues or []:
+            entry = metadata['issues'].get(str(issue_data['number']))
+            if entry is not None:
+                entry.update(self._quick_check_fields(issue_data))
+        if etag:
+            metadata['listing_etag'] = etag
+            metadata['listing_fetched_at'] = datetime.now(timezone.utc).isoformat()
+        else:
+            metadata.pop('listing_etag', None)
+            metadata.pop('listing_fetched_at', None)
+        self._write_metadata(repo_name, metadata)
+    
     def issue_exists(self, repo_name: str, issue_number: int) -> bool:
         """Check if an issue file exists.
         
@@ -300,16 +567,22 @@ class IssueStorage:
         if not repo_dir.exists():
             return []
         
+        # Plain directory entries instead of glob(): no pattern matching and
+        # no Path object per file
         issue_numbers = []
-        for file_path in repo_dir.glob('issue-*.md'):
-            # Extract number from filename like 'issue-123.md'
-            try:
-                number = int(file_path.stem.split('-')[1])
-                issue_numbers.append(number)
-            except (IndexError, ValueError):
-                continue
-        
-        return sorted(issue_numbers)
+        with os.scandir(repo_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith('issue-') and name.endswith('.md')):
+                    continue
+                # Extract number from filename like 'issue-123.md'
+                try:
+                    issue_numbers.append(int(name[6:-3]))
+                except ValueError:
+                    continue
+        
+        issue_numbers.sort()
+        return issue_numbers
 
     def delete_issue(self, repo_name: str, issue_number: int) -> bool:
         """Delete a locally stored issue file and remove it from metadata.
@@ -331,11 +604,10 @@ class IssueStorage:
 
         # Remove the entry from metadata
         metadata_file = repo_dir / '.metadata.json'
-        if metadata_file.exists():
+        if metadata_file.exists() or repo_name in self._pending:
             metadata = self.load_metadata(repo_name)
             metadata['issues'].pop(str(issue_number), None)
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2)
+            self._write_metadata(repo_name, metadata)
 
         return True
 
@@ -370,8 +642,10 @@ class IssueStorage:
         frontmatter_str = parts[1]
         rest = parts[2]
 
+        import yaml
+
         try:
-            frontmatter = yaml.safe_load(frontmatter_str)
+            frontmatter = yaml.load(frontmatter_str, Loader=yaml_classes()[0])
         except yaml.YAMLError:
             return None
 
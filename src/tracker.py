@@ -14,6 +14,36 @@ class ChangeTracker:
             storage: IssueStorage instance for accessing metadata
         """
         self.storage = storage
+        
+        # Metadata read per repository, shared by the calls of one sync
+        self._metadata_cache: Dict[str, Dict[str, Any]] = {}
+    
+    def _get_metadata(self, repo_name: str) -> Dict[str, Any]:
+        """Load a repository's metadata once and reuse it afterwards.
+        
+        The stored state is what a sync compares against, so it is read once
+        at the start; metadata written during the sync is not seen here.
+        
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            
+        Returns:
+            Metadata dictionary as returned by IssueStorage.load_metadata
+        """
+        if repo_name not in self._metadata_cache:
+            self._metadata_cache[repo_name] = self.storage.load_metadata(repo_name)
+        return self._metadata_cache[repo_name]
+    
+    def seed_metadata(self, repo_name: str, metadata: Dict[str, Any]):
+        """Use metadata the caller already loaded instead of reading it again.
+        
+        The dict must not be modified for the rest of the sync.
+        
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            metadata: Metadata dictionary as returned by IssueStorage.load_metadata
+        """
+        self._metadata_cache[repo_name] = metadata
     
     def detect_changes(self, repo_name: str, current_issues: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Detect changes between stored issues and current issues.
@@ -27,39 +57,58 @@ class ChangeTracker:
             {
                 'new': [list of new issues],
                 'updated': [list of updated issues with details],
-                'unchanged': [list of unchanged issue numbers]
+                'unchanged': [list of unchanged issue numbers],
+                'resave': [list of issues to rewrite without reporting them]
             }
+            Each 'updated' entry holds the issue, the change descriptions
+            and the markdown rendered to hash it, which can be passed on to
+            IssueStorage.save_issues instead of rendering it again.
         """
-        metadata = self.storage.load_metadata(repo_name)
+        metadata = self._get_metadata(repo_name)
         stored_issues = metadata.get('issues', {})
-        stored_issue_numbers = set(stored_issues.keys())
-        current_issue_numbers = {str(issue['number']) for issue in current_issues}
         
         changes = {
             'new': [],
             'updated': [],
-            'unchanged': []
+            'unchanged': [],
+            'resave': []
         }
         
         for issue in current_issues:
             issue_number = str(issue['number'])
-            current_hash = self.storage._calculate_hash(issue)
+            stored = stored_issues.get(issue_number)
             
-            if issue_number not in stored_issue_numbers:
+            if stored is None:
                 # New issue
                 changes['new'].append(issue)
+            elif all(key in stored and stored[key] == value
+                     for key, value in self.storage._quick_check_fields(issue).items()):
+                # Same GitHub timestamp, project status, comment count and
+                # latest comment edit: nothing to hash
+                changes['unchanged'].append(int(issue_number))
+            elif 'comments_count' not in stored and stored.get('updated_at') == issue['updated_at'] \
+                    and stored.get('state') == issue['state']:
+                # Entry written before quick-check fields and the markdown
+                # hash existed: its hash can never match, and a project
+                # status change or comment edit since then would not show
+                # in the timestamp. Report it as unchanged, but have the
+                # file rewritten so it and its metadata are current.
+                changes['unchanged'].append(int(issue_number))
+                changes['resave'].append(issue)
             else:
                 # Check if issue changed
-                stored_hash = stored_issues[issue_number].get('hash')
+                markdown, current_hash = self.storage._render_issue(issue)
+                stored_hash = stored.get('hash')
                 
                 if current_hash != stored_hash:
                     # Issue changed - detect what changed
                     change_details = self._detect_issue_changes(
-                        repo_name, issue, stored_issues[issue_number]
+                        repo_name, issue, stored
                     )
                     changes['updated'].append({
                         'issue': issue,
-                        'changes': change_details
+                        'changes': change_details,
+                        'markdown': markdown
                     })
                 else:
                     changes['unchanged'].append(int(issue_number))
@@ -108,7 +157,7 @@ class ChangeTracker:
         Returns:
             List of issue numbers that are stored locally but not in current issues
         """
-        metadata = self.storage.load_metadata(repo_name)
+        metadata = self._get_metadata(repo_name)
         stored_issues = metadata.get('issues', {})
         stored_issue_numbers = {int(num) for num in stored_issues.keys()}
         current_issue_numbers = {issue['number'] for issue in current_issues}